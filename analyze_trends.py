@@ -10,10 +10,14 @@ import json
 import re
 from datetime import datetime, timedelta
 from collections import Counter, defaultdict
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 
-def load_data(filepath: str = "social_data.json") -> Dict:
-    """Load the social data JSON file."""
+from storage import get_store
+
+def load_data(filepath: Optional[str] = None) -> Dict:
+    """Load the collected data from the configured store, or from a JSON export at filepath."""
+    if filepath is None:
+        return get_store().load()
     with open(filepath, "r", encoding="utf-8") as f:
         return json.load(f)
 
@@ -34,6 +34,7 @@ class PostResponse(BaseModel):
     total: int
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
 
 
 class PostStats(BaseModel):
@@ -56,3 +57,4 @@ class PostFilter(BaseModel):
     date_to: Optional[str] = None
     limit: int = Field(default=50, ge=1, le=500)
     offset: int = Field(default=0, ge=0)
+    cursor: Optional[str] = None
@@ -1,7 +1,7 @@
 """
 Posts API routes.
 """
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query
 from typing import Optional
 
 from ..models.post_models import PostResponse, PostStats
@@ -20,6 +20,7 @@ async def get_posts(
     date_to: Optional[str] = None,
     limit: int = Query(default=50, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
+    cursor: Optional[str] = None,
 ):
     """
     Get posts with optional filtering and pagination.
@@ -31,16 +32,21 @@ async def get_posts(
     - **date_to**: Filter posts until this date (ISO format)
     - **limit**: Number of posts to return (1-500)
     - **offset**: Number of posts to skip
+    - **cursor**: `next_cursor` from the previous page; continues right after it
     """
-    result = data_service.filter_posts(
-        platform=platform,
-        post_type=type,
-        author=author,
-        date_from=date_from,
-        date_to=date_to,
-        limit=limit,
-        offset=offset,
-    )
+    try:
+        result = data_service.filter_posts(
+            platform=platform,
+            post_type=type,
+            author=author,
+            date_from=date_from,
+            date_to=date_to,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     return PostResponse(**result)
 
 
@@ -55,12 +61,11 @@ async def get_stats():
 async def get_recent_posts(
     days: int = Query(default=7, ge=1, le=365),
     limit: int = Query(default=50, ge=1, le=500),
+    cursor: Optional[str] = None,
 ):
     """Get recent posts from the last N days."""
-    posts = data_service.get_recent_posts(days=days, limit=limit)
-    return PostResponse(
-        posts=posts,
-        total=len(posts),
-        limit=limit,
-        offset=0,
-    )
+    try:
+        result = data_service.query_recent_posts(days=days, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return PostResponse(**result)
@@ -56,8 +56,8 @@ async def get_trends_file():
 async def get_dashboard_data():
     """Get dashboard data as JSON for frontend rendering."""
     try:
-        data = data_service.load_posts()
-        stats = data_service.get_stats()
+        meta = data_service.get_meta()
+        stats = meta.get("stats", {})
 
         # Get platform distribution
         platform_dist = stats.get("by_platform", {})
@@ -80,8 +80,8 @@ async def get_dashboard_data():
             "stats": stats,
             "platform_distribution": platform_dist,
             "timeline": dict(sorted(timeline.items())),
-            "total_posts": len(data.get("posts", [])),
-            "last_updated": data.get("last_updated"),
+            "total_posts": meta.get("total_posts", 0),
+            "last_updated": meta.get("last_updated"),
         })
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get dashboard data: {str(e)}")
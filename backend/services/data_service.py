@@ -1,38 +1,54 @@
 """
-Data access service for JSON file operations.
+Data access service for stored posts.
 """
-import json
+import sys
 import os
 from datetime import datetime
 from typing import Dict, List, Optional
 
+# Add parent directory to path to import config and storage
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import config
+from storage import PostStore, create_store, get_store, get_snapshot_cache
+
 
 class DataService:
-    """Service for managing social_data.json."""
+    """Service for reading and writing stored posts."""
 
-    def __init__(self, data_file: str = "social_data.json"):
-        self.data_file = data_file
+    def __init__(
+        self,
+        data_file: Optional[str] = None,
+        store: Optional[PostStore] = None,
+        use_cache: bool = True,
+    ):
+        self.data_file = data_file or config.DATA_FILE
+        if store is None:
+            store = get_store() if data_file is None else create_store(
+                getattr(config, "STORAGE_BACKEND", "sqlite"),
+                data_file,
+                getattr(config, "DATABASE_FILE", "social_data.db"),
+            )
+        self.store = store
+        # Shared with every other DataService reading the same store
+        self.cache = get_snapshot_cache(self.store) if use_cache else None
 
     def load_posts(self) -> Dict:
-        """Load all data from the JSON file."""
-        if os.path.exists(self.data_file):
-            try:
-                with open(self.data_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
-
-        return {
-            "posts": [],
-            "last_updated": None,
-            "stats": {},
-        }
+        """
+        Load all data.
+
+        With the cache enabled this is the shared snapshot; treat it as read-only.
+        """
+        if self.cache:
+            return self.cache.get().data
+        return self.store.load()
 
     def save_posts(self, data: Dict):
-        """Save data to the JSON file."""
+        """Replace the stored data."""
         data["last_updated"] = datetime.now().isoformat()
-        with open(self.data_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        self.store.save(data)
+        if self.cache:
+            self.cache.invalidate()
 
     def filter_posts(
         self,
@@ -43,66 +59,51 @@ class DataService:
         date_to: Optional[str] = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> Dict:
         """
         Filter and paginate posts.
 
         Returns:
-            Dict with 'posts', 'total', 'limit', 'offset'
-        """
-        data = self.load_posts()
-        posts = data.get("posts", [])
-
-        # Apply filters
-        filtered = posts
-
-        if platform:
-            filtered = [p for p in filtered if p.get("platform") == platform]
-
-        if post_type:
-            filtered = [p for p in filtered if p.get("type") == post_type]
-
-        if author:
-            filtered = [p for p in filtered if author.lower() in (p.get("author") or "").lower()]
-
-        if date_from:
-            filtered = [
-                p for p in filtered
-                if (p.get("published") or p.get("fetched_at", "")) >= date_from
-            ]
+            Dict with 'posts', 'total', 'limit', 'offset', 'next_cursor'
 
-        if date_to:
-            filtered = [
-                p for p in filtered
-                if (p.get("published") or p.get("fetched_at", "")) <= date_to
-            ]
-
-        # Sort by published date (newest first)
-        filtered.sort(
-            key=lambda x: x.get("published") or x.get("fetched_at", ""),
-            reverse=True
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        source = self.cache.get() if self.cache else self.store
+        return source.query(
+            platform=platform,
+            post_type=post_type,
+            author=author,
+            date_from=date_from,
+            date_to=date_to,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
         )
 
-        # Paginate
-        total = len(filtered)
-        paginated = filtered[offset:offset + limit]
-
-        return {
-            "posts": paginated,
-            "total": total,
-            "limit": limit,
-            "offset": offset,
-        }
+    def get_meta(self) -> Dict:
+        """Get 'last_updated', 'stats' and 'total_posts' without loading posts."""
+        if self.cache:
+            return self.cache.get().get_meta()
+        return self.store.get_meta()
 
     def get_stats(self) -> Dict:
         """Get statistics from the data."""
-        data = self.load_posts()
-        return data.get("stats", {})
+        return self.get_meta().get("stats", {})
 
-    def get_recent_posts(self, days: int = 7, limit: int = 50) -> List[Dict]:
-        """Get posts from the last N days."""
+    def query_recent_posts(self, days: int = 7, limit: int = 50, cursor: Optional[str] = None) -> Dict:
+        """
+        Get a page of posts from the last N days.
+
+        Returns:
+            Dict with 'posts', 'total', 'limit', 'offset', 'next_cursor'
+        """
         from datetime import timedelta
 
         cutoff = (datetime.now() - timedelta(days=days)).isoformat()
-        result = self.filter_posts(date_from=cutoff, limit=limit)
-        return result["posts"]
+        return self.filter_posts(date_from=cutoff, limit=limit, cursor=cursor)
+
+    def get_recent_posts(self, days: int = 7, limit: int = 50) -> List[Dict]:
+        """Get posts from the last N days."""
+        return self.query_recent_posts(days=days, limit=limit)["posts"]
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+YouTube Feed Parser Benchmark
+==============================
+Compares the streaming Atom parser with feedparser on YouTube feeds and
+checks that both produce the same video dicts.
+
+Usage:
+    python bench_youtube_parser.py                  # generated sample feed
+    python bench_youtube_parser.py feeds/*.xml      # recorded feeds
+    python bench_youtube_parser.py --rounds 50 feeds/*.xml
+"""
+
+import argparse
+import time
+from typing import Callable, Dict, List
+
+from platforms.youtube import parse_atom_entries, parse_entries_feedparser
+
+
+SAMPLE_ENTRY = """
+ <entry>
+  <id>yt:video:vid{n:08d}</id>
+  <yt:videoId>vid{n:08d}</yt:videoId>
+  <yt:channelId>UCsample0000000000000000</yt:channelId>
+  <title>Prop firm payout update #{n} &amp; Q&amp;A</title>
+  <link rel="alternate" href="https://www.youtube.com/watch?v=vid{n:08d}"/>
+  <author>
+   <name>Sample Channel</name>
+   <uri>https://www.youtube.com/channel/UCsample0000000000000000</uri>
+  </author>
+  <published>2026-10-{day:02d}T12:00:00+00:00</published>
+  <updated>2026-10-{day:02d}T13:30:00+00:00</updated>
+  <media:group>
+   <media:title>Prop firm payout update #{n} &amp; Q&amp;A</media:title>
+   <media:content url="https://www.youtube.com/v/vid{n:08d}?version=3" type="application/x-shockwave-flash" width="640" height="390"/>
+   <media:thumbnail url="https://i2.ytimg.com/vi/vid{n:08d}/hqdefault.jpg" width="480" height="360"/>
+   <media:description>{description}</media:description>
+   <media:community>
+    <media:starRating count="{n}" average="5.00" min="1" max="5"/>
+    <media:statistics views="{views}"/>
+   </media:community>
+  </media:group>
+ </entry>"""
+
+SAMPLE_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015" xmlns:media="http://search.yahoo.com/mrss/" xmlns="http://www.w3.org/2005/Atom">
+ <link rel="self" href="http://www.youtube.com/feeds/videos.xml?channel_id=UCsample0000000000000000"/>
+ <id>yt:channel:UCsample0000000000000000</id>
+ <yt:channelId>UCsample0000000000000000</yt:channelId>
+ <title>Sample Channel</title>
+ <link rel="alternate" href="https://www.youtube.com/channel/UCsample0000000000000000"/>
+ <author>
+  <name>Sample Channel</name>
+  <uri>https://www.youtube.com/channel/UCsample0000000000000000</uri>
+ </author>
+ <published>2020-01-01T00:00:00+00:00</published>{entries}
+</feed>
+"""
+
+
+def sample_feed(entries: int = 15) -> bytes:
+    """Build a feed shaped like YouTube's, with the usual 15 entries."""
+    description = (
+        "Today we go through the latest payout rules, drawdown limits and "
+        "evaluation changes. Timestamps below — links in the pinned comment. "
+    ) * 6
+    return SAMPLE_FEED.format(entries="".join(
+        SAMPLE_ENTRY.format(n=n, day=n % 28 + 1, views=n * 1234, description=description)
+        for n in range(entries)
+    )).encode("utf-8")
+
+
+def comparable(videos: List[Dict]) -> List[Dict]:
+    """Drop fields that legitimately differ between runs."""
+    return [{key: value for key, value in video.items() if key != "fetched_at"} for video in videos]
+
+
+def time_parser(parse: Callable[[bytes, str], List[Dict]], feeds: List[bytes], rounds: int) -> float:
+    """Seconds of CPU time to parse every feed once, averaged over rounds."""
+    started = time.process_time()
+    for _ in range(rounds):
+        for content in feeds:
+            parse(content, "Sample Channel")
+    return (time.process_time() - started) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark YouTube feed parsers")
+    parser.add_argument("feeds", nargs="*", help="Recorded feed XML files (default: a generated sample)")
+    parser.add_argument("--rounds", type=int, default=20, help="Times each feed is parsed per parser")
+    args = parser.parse_args()
+
+    if args.feeds:
+        feeds = []
+        for path in args.feeds:
+            with open(path, "rb") as f:
+                feeds.append(f.read())
+    else:
+        feeds = [sample_feed()]
+
+    mismatches = 0
+    for content in feeds:
+        if comparable(parse_atom_entries(content)) != comparable(parse_entries_feedparser(content)):
+            mismatches += 1
+
+    atom = time_parser(parse_atom_entries, feeds, args.rounds)
+    fallback = time_parser(parse_entries_feedparser, feeds, args.rounds)
+
+    print(f"📊 {len(feeds)} feeds, {args.rounds} rounds")
+    print(f"   feedparser: {fallback * 1000:8.2f} ms CPU per pass")
+    print(f"   streaming:  {atom * 1000:8.2f} ms CPU per pass ({fallback / atom:.1f}x faster)")
+    if mismatches:
+        print(f"⚠️  {mismatches} feeds parsed differently")
+    else:
+        print("✅ Both parsers produced the same videos")
+
+
+if __name__ == "__main__":
+    main()
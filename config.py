@@ -4,6 +4,12 @@ Social Media Listener Configuration
 Add your API credentials and monitoring targets here.
 """
 
+import os
+
+# Directory holding the post store and the monitors' state files (cursors,
+# caches, usage ledger). docker-compose sets it to a mounted volume.
+DATA_DIR = os.environ.get("SOCIAL_LISTENER_DATA_DIR", ".")
+
 # =============================================================================
 # MONITORING TARGETS
 # =============================================================================
@@ -66,6 +72,8 @@ TWITTER_API = {
     "api_secret": "",
     "access_token": "",
     "access_token_secret": "",
+    "max_query_length": 512,  # 1024 on the Pro tier
+    "max_pages": 10,  # Result pages (up to 100 tweets each) per search
 }
 
 # Meta Graph API (https://developers.facebook.com/)
@@ -73,6 +81,11 @@ META_API = {
     "app_id": "",
     "app_secret": "",
     "access_token": "",  # Page Access Token
+    "batch_size": 50,  # Page/account requests per batch call (1 = no batching)
+    # Newest post time seen per page/account, so each cycle only asks for
+    # newer posts. Set since_file to "" to always fetch the latest page.
+    "since_file": os.path.join(DATA_DIR, "meta_since.json"),
+    "max_pages": 10,  # Result pages followed per page/account
 }
 
 # LinkedIn API (https://developer.linkedin.com/)
@@ -80,6 +93,17 @@ LINKEDIN_API = {
     "client_id": "",
     "client_secret": "",
     "access_token": "",
+    # Vanity name -> organization ID lookups, shared by the CLI and backend.
+    # Names that match no organization are retried after org_cache_miss_ttl.
+    # Set org_cache_file to "" to look names up every cycle.
+    "org_cache_file": os.path.join(DATA_DIR, "linkedin_orgs.json"),
+    "org_cache_ttl": 30 * 24 * 3600,
+    "org_cache_miss_ttl": 24 * 3600,
+    "max_concurrency": 4,  # Companies fetched at once (1 = one at a time)
+    # Newest post seen per company; later cycles page back until they reach
+    # it (at most max_pages pages). Set to "" to fetch only the first page.
+    "last_seen_file": os.path.join(DATA_DIR, "linkedin_last_seen.json"),
+    "max_pages": 5,
 }
 
 # YouTube Data API (https://console.cloud.google.com/) - Optional for enhanced features
@@ -91,6 +115,33 @@ YOUTUBE_API = {
 # Grok has direct real-time access to X data - no separate Twitter API needed!
 GROK_API = {
     "api_key": "",  # Add your xAI API key here
+    "max_concurrency": 4,  # Searches run at the same time (1 = one by one)
+    "call_timeout": 120,  # Seconds allowed per search
+    "model": "grok-4-fast",
+    # Parsed results of each search are reused for cache_ttl seconds, so
+    # repeated runs (and restarts) don't pay for the same search again.
+    # Set cache_file to "" to disable.
+    "cache_file": os.path.join(DATA_DIR, "grok_cache.json"),
+    "cache_ttl": 1800,
+    "cache_max_entries": 500,
+    # When each keyword/account was last searched successfully; later
+    # searches only cover the time since then (minus the overlap) instead
+    # of the full week. Set watermark_file to "" to always search the week.
+    "watermark_file": os.path.join(DATA_DIR, "grok_watermarks.json"),
+    "window_overlap_minutes": 60,
+    "stream": True,  # Parse posts while the response streams in
+    # Ask for up to this many keywords in one prompt, keeping each batch's
+    # expected response under batch_token_budget tokens (1 = one per prompt)
+    "keyword_batch_size": 4,
+    "batch_token_budget": 8000,
+    # Tokens, latency and posts per search target are recorded in
+    # ledger_file. When a budget is set (0 = unlimited), searches that
+    # would exceed it are skipped, lowest-yield targets first (accounts and
+    # keywords ranked together). The daily budget needs the ledger.
+    "ledger_file": os.path.join(DATA_DIR, "grok_usage.json"),
+    "cycle_token_budget": 0,
+    "daily_token_budget": 0,
+    "token_prices": {"input": 0.20, "output": 0.50},  # USD per million tokens
 }
 
 # X accounts to monitor via Grok (alternative to TWITTER_ACCOUNTS)
@@ -112,11 +163,53 @@ GROK_X_ACCOUNTS = [
 # How often to check for new posts (in minutes)
 CHECK_INTERVAL = 30
 
+# YouTube feeds fetched at once, and the per-feed timeout (in seconds)
+YOUTUBE_MAX_WORKERS = 8
+YOUTUBE_FEED_TIMEOUT = 15
+
+# Feed validators (ETag/Last-Modified) and parsed entries from the last
+# fetch, so unchanged feeds are neither downloaded nor parsed again.
+# Set to "" to always fetch feeds in full.
+YOUTUBE_FEED_CACHE_FILE = os.path.join(DATA_DIR, "youtube_feed_cache.json")
+
+# Shared HTTP client used by all platform monitors: timeouts in seconds,
+# and retries (with exponential backoff and jitter) on 429/5xx responses
+HTTP_SETTINGS = {
+    "connect_timeout": 5,
+    "read_timeout": 30,
+    "max_retries": 3,
+    "backoff_factor": 0.5,
+    # Pace calls using the APIs' rate-limit headers; calls that would wait
+    # longer than rate_limit_max_wait seconds are deferred to the next cycle
+    "respect_rate_limits": True,
+    "rate_limit_max_wait": 30,
+}
+
+# Newest tweet ID seen per Twitter search, so each cycle only requests
+# newer tweets. Set to "" to always search the last 24 hours.
+TWITTER_CURSOR_FILE = os.path.join(DATA_DIR, "twitter_cursors.json")
+
+# Fetch platforms (YouTube, Twitter/X, Meta, LinkedIn) concurrently
+PARALLEL_FETCH = True
+
+# Seconds each platform may take per cycle before its results are dropped
+PLATFORM_TIMEOUTS = {
+    "youtube": 120,
+    "twitter": 300,
+    "meta": 120,
+    "linkedin": 120,
+}
+
 # Maximum posts to store per platform
 MAX_POSTS_PER_PLATFORM = 500
 
 # Data storage location
-DATA_FILE = "social_data.json"
+DATA_FILE = os.path.join(DATA_DIR, "social_data.json")
+
+# Storage backend: "sqlite" (one row per post) or "json" (legacy single file).
+# The sqlite backend imports an existing DATA_FILE the first time it runs.
+STORAGE_BACKEND = "sqlite"
+DATABASE_FILE = os.path.join(DATA_DIR, "social_data.db")
 
 # Dashboard output location
 DASHBOARD_FILE = "dashboard.html"
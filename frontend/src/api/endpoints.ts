@@ -15,10 +15,11 @@ export const postsApi = {
     author?: string;
     limit?: number;
     offset?: number;
+    cursor?: string;
   }) => apiClient.get('/posts', { params: filters }),
   getStats: () => apiClient.get('/posts/stats'),
-  getRecent: (days = 7, limit = 50) =>
-    apiClient.get('/posts/recent', { params: { days, limit } }),
+  getRecent: (days = 7, limit = 50, cursor?: string) =>
+    apiClient.get('/posts/recent', { params: { days, limit, cursor } }),
 };
 
 export const configApi = {
@@ -4,21 +4,25 @@ import { usePosts } from '../../hooks/usePosts';
 export function PostList() {
   const [platform, setPlatform] = useState<string>('');
   const [limit, setLimit] = useState(50);
-  const [offset, setOffset] = useState(0);
+  // Cursor of every page visited so far; the last one is the current page
+  const [cursors, setCursors] = useState<(string | undefined)[]>([undefined]);
+  const offset = (cursors.length - 1) * limit;
 
   const { data, isLoading } = usePosts({
     platform: platform || undefined,
     limit,
-    offset,
+    cursor: cursors[cursors.length - 1],
   });
 
   const handlePrevious = () => {
-    setOffset(Math.max(0, offset - limit));
+    if (cursors.length > 1) {
+      setCursors(cursors.slice(0, -1));
+    }
   };
 
   const handleNext = () => {
-    if (data && offset + limit < data.total) {
-      setOffset(offset + limit);
+    if (data?.next_cursor) {
+      setCursors([...cursors, data.next_cursor]);
     }
   };
 
@@ -35,7 +39,7 @@ export function PostList() {
               value={platform}
               onChange={(e) => {
                 setPlatform(e.target.value);
-                setOffset(0);
+                setCursors([undefined]);
               }}
               className="border rounded px-3 py-2"
             >
@@ -54,7 +58,7 @@ export function PostList() {
               value={limit}
               onChange={(e) => {
                 setLimit(parseInt(e.target.value));
-                setOffset(0);
+                setCursors([undefined]);
               }}
               className="border rounded px-3 py-2"
             >
@@ -136,14 +140,14 @@ export function PostList() {
               <div className="flex space-x-2">
                 <button
                   onClick={handlePrevious}
-                  disabled={offset === 0}
+                  disabled={cursors.length === 1}
                   className="px-4 py-2 border rounded disabled:opacity-50"
                 >
                   Previous
                 </button>
                 <button
                   onClick={handleNext}
-                  disabled={offset + limit >= data.total}
+                  disabled={!data.next_cursor}
                   className="px-4 py-2 border rounded disabled:opacity-50"
                 >
                   Next
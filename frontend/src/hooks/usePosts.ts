@@ -7,6 +7,7 @@ export function usePosts(filters?: {
   author?: string;
   limit?: number;
   offset?: number;
+  cursor?: string;
 }) {
   return useQuery({
     queryKey: ['posts', filters],
@@ -11,12 +11,16 @@ Usage:
     python listener.py --dashboard  # Only regenerate dashboard
 """
 
+import io
 import os
 import sys
-import json
+import threading
+import time
 import argparse
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from datetime import datetime
-from typing import List, Dict
+from itertools import chain
+from typing import Callable, List, Dict, Tuple
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -26,66 +30,125 @@ from platforms.youtube import fetch_all_channels as fetch_youtube, search_videos
 from platforms.twitter import create_monitor as create_twitter_monitor
 from platforms.meta import create_monitor as create_meta_monitor
 from platforms.linkedin import create_monitor as create_linkedin_monitor
-from platforms.grok_x import create_monitor as create_grok_monitor
+from platforms.grok_x import create_monitor as create_grok_monitor, migrate_content_ids
 from platforms.manual import ManualEntryManager
+from platforms.http_client import configure as configure_http
+from storage import get_store, post_key, DedupIndex
 from dashboard import generate_dashboard
 from analyze_trends import analyze_data, generate_report as generate_trend_report
 
 
+class _StageOutput(io.TextIOBase):
+    """
+    Stand-in for sys.stdout that holds back what each fetch stage prints
+    and writes it as one block when the stage completes, so concurrent
+    stages don't interleave their progress lines. Output from other
+    threads passes straight through.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._buffers: Dict[int, List[str]] = {}
+        self._lock = threading.Lock()
+
+    def capture(self):
+        """Start holding back the current thread's output."""
+        self._buffers[threading.get_ident()] = []
+
+    def release(self):
+        """Write the current thread's held-back output and stop holding it."""
+        buffer = self._buffers.pop(threading.get_ident(), [])
+        with self._lock:
+            self.stream.write("".join(buffer))
+            self.stream.flush()
+
+    def write(self, text: str) -> int:
+        buffer = self._buffers.get(threading.get_ident())
+        if buffer is not None:
+            buffer.append(text)
+            return len(text)
+        with self._lock:
+            return self.stream.write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+def _buffered_stage(stage: Callable[[], List[Dict]]) -> Callable[[], List[Dict]]:
+    """Wrap a fetch stage so its output is printed in one block when it completes."""
+    if not isinstance(sys.stdout, _StageOutput):
+        sys.stdout = _StageOutput(sys.stdout)
+    output = sys.stdout
+
+    def run() -> List[Dict]:
+        output.capture()
+        try:
+            return stage()
+        finally:
+            output.release()
+
+    return run
+
+
 class SocialMediaListener:
     """Main social media listening orchestrator."""
 
     def __init__(self):
         """Initialize the listener with configured monitors."""
         self.data_file = config.DATA_FILE
+        self.store = get_store()
+        # Collapse Grok posts stored again under per-process hash IDs
+        if self.store.run_migration("grok_content_ids", migrate_content_ids):
+            print("🔧 Migrated Grok post IDs to content IDs")
         self.data = self._load_data()
-
-        # Initialize platform monitors
-        self.twitter = create_twitter_monitor(config.TWITTER_API)
+        # Seeded from the posts just loaded, so keys are not read twice
+        self.dedup = DedupIndex(self.store, self.data["posts"])
+
+        # Changes not yet written to the store
+        self._pending_added: List[Dict] = []
+        self._pending_removed: List[Tuple[str, str]] = []
+
+        # Platform stages started by fetch_all, kept to detect overruns
+        self._running_stages: Dict[str, Future] = {}
+        # Stages that timed out; their posts are collected once they finish
+        self._abandoned_stages: Dict[str, Future] = {}
+
+        # Initialize platform monitors (sharing one pooled HTTP client)
+        configure_http(**getattr(config, "HTTP_SETTINGS", {}))
+        self.twitter = create_twitter_monitor(
+            config.TWITTER_API,
+            cursor_file=getattr(config, "TWITTER_CURSOR_FILE", "") or None,
+        )
         self.meta = create_meta_monitor(config.META_API)
         self.linkedin = create_linkedin_monitor(config.LINKEDIN_API)
         self.grok = create_grok_monitor(getattr(config, 'GROK_API', {}))
         self.manual = ManualEntryManager()
 
     def _load_data(self) -> Dict:
-        """Load existing data from file."""
-        if os.path.exists(self.data_file):
-            try:
-                with open(self.data_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
-
-        return {
-            "posts": [],
-            "last_updated": None,
-            "stats": {},
-        }
+        """Load existing data from the store."""
+        return self.store.load()
 
     def _save_data(self):
-        """Save data to file."""
+        """Write the posts added and removed since the last save to the store."""
         self.data["last_updated"] = datetime.now().isoformat()
-        with open(self.data_file, "w", encoding="utf-8") as f:
-            json.dump(self.data, f, indent=2, ensure_ascii=False)
+        self.store.apply_changes(
+            self._pending_added,
+            self._pending_removed,
+            stats=self.data.get("stats", {}),
+            last_updated=self.data["last_updated"],
+        )
+        self._pending_added = []
+        self._pending_removed = []
+        self.dedup.commit()
+
+    def _add_posts(self, posts: List[Dict]):
+        """Add deduplicated posts to the in-memory data and queue them for saving."""
+        self.data["posts"].extend(posts)
+        self._pending_added.extend(posts)
 
     def _deduplicate(self, posts: List[Dict]) -> List[Dict]:
         """Remove duplicate posts based on ID and platform."""
-        seen = set()
-        unique = []
-
-        # First, add existing posts to seen set
-        for post in self.data.get("posts", []):
-            key = (post.get("platform", ""), post.get("id", ""))
-            seen.add(key)
-
-        # Add new unique posts
-        for post in posts:
-            key = (post.get("platform", ""), post.get("id", ""))
-            if key not in seen:
-                seen.add(key)
-                unique.append(post)
-
-        return unique
+        return self.dedup.filter_new(posts)
 
     def _trim_old_posts(self):
         """Trim posts to stay within limits."""
@@ -108,98 +171,235 @@ class SocialMediaListener:
                 reverse=True
             )
             trimmed.extend(posts[:max_posts])
+            removed = [post_key(post) for post in posts[max_posts:]]
+            self._pending_removed.extend(removed)
+            self.dedup.discard(removed)
 
         self.data["posts"] = trimmed
 
-    def fetch_all(self) -> Dict[str, int]:
-        """
-        Fetch posts from all configured platforms.
-
-        Returns:
-            Dictionary with count of new posts per platform
-        """
-        results = {}
-
-        # YouTube (RSS feeds - no API key needed)
+    def _fetch_youtube(self) -> List[Dict]:
+        """Fetch YouTube videos (RSS feeds - no API key needed)."""
         print("\n📺 Fetching YouTube...")
-        youtube_posts = fetch_youtube(config.YOUTUBE_CHANNELS)
+        youtube_posts = fetch_youtube(
+            config.YOUTUBE_CHANNELS,
+            max_workers=getattr(config, "YOUTUBE_MAX_WORKERS", 8),
+            timeout=getattr(config, "YOUTUBE_FEED_TIMEOUT", 15),
+            cache_file=getattr(config, "YOUTUBE_FEED_CACHE_FILE", "") or None,
+        )
         if config.KEYWORDS:
             youtube_posts = search_videos_for_keywords(youtube_posts, config.KEYWORDS)
-        new_youtube = self._deduplicate(youtube_posts)
-        results["youtube"] = len(new_youtube)
-        self.data["posts"].extend(new_youtube)
+        return youtube_posts
 
-        # Twitter/X (via native API or Grok)
+    def _fetch_twitter(self) -> List[Dict]:
+        """Fetch Twitter/X posts (via Grok or the native API)."""
         twitter_posts = []
 
         # Option 1: Use Grok for X searching (preferred - uses x_search tool)
         if self.grok.is_configured():
             print("\n🤖 Fetching X via Grok...")
+            self.grok.begin_cycle()
 
-            # Fetch from monitored accounts
+            # Monitored accounts and keywords share one pool of searches
             grok_accounts = getattr(config, 'GROK_X_ACCOUNTS', [])
-            if grok_accounts:
-                twitter_posts.extend(self.grok.search_accounts(grok_accounts))
+            if grok_accounts or config.KEYWORDS:
+                twitter_posts.extend(self.grok.search(grok_accounts, config.KEYWORDS))
 
-            # Search for keywords
-            if config.KEYWORDS:
-                twitter_posts.extend(self.grok.search_keywords(config.KEYWORDS))
+            usage = self.grok.cycle_usage
+            print(f"   💰 Grok: {usage['calls']} calls, "
+                  f"{usage['prompt_tokens'] + usage['completion_tokens']:,} tokens "
+                  f"(~${self.grok.cycle_cost():.4f})")
 
         # Option 2: Fall back to native Twitter API if configured
         elif self.twitter.is_configured():
             print("\n🐦 Fetching Twitter/X...")
 
-            # Fetch from monitored accounts
+            # Monitored accounts, then keyword searches
+            searches = []
             if config.TWITTER_ACCOUNTS:
-                twitter_posts.extend(self.twitter.fetch_accounts(config.TWITTER_ACCOUNTS))
-
-            # Search for keywords
+                searches.append(self.twitter.fetch_accounts(config.TWITTER_ACCOUNTS))
             if config.KEYWORDS:
-                twitter_posts.extend(self.twitter.search_keywords(config.KEYWORDS))
+                searches.append(self.twitter.search_keywords(config.KEYWORDS))
+
+            # Stored tweets are dropped page by page as the searches run
+            twitter_posts.extend(self.dedup.iter_unstored(chain.from_iterable(searches)))
         else:
             print("\n⚠️  Twitter/X: Not configured")
             print("   Option 1: Add api_key to GROK_API (recommended)")
             print("   Option 2: Add bearer_token to TWITTER_API")
 
-        new_twitter = self._deduplicate(twitter_posts)
-        results["twitter"] = len(new_twitter)
-        self.data["posts"].extend(new_twitter)
-
-        # Meta (Facebook/Instagram)
-        if self.meta.is_configured():
-            print("\n📘 Fetching Facebook/Instagram...")
-            meta_posts = self.meta.fetch_all_pages(config.META_PAGES)
-            new_meta = self._deduplicate(meta_posts)
-            results["meta"] = len(new_meta)
-            self.data["posts"].extend(new_meta)
-        else:
+        return twitter_posts
+
+    def _fetch_meta(self) -> List[Dict]:
+        """Fetch Facebook/Instagram posts."""
+        if not self.meta.is_configured():
             print("\n⚠️  Meta (Facebook/Instagram): Not configured (add access_token to config)")
-            results["meta"] = 0
-
-        # LinkedIn
-        if self.linkedin.is_configured():
-            print("\n💼 Fetching LinkedIn...")
-            linkedin_posts = self.linkedin.fetch_all_companies(config.LINKEDIN_COMPANIES)
-            new_linkedin = self._deduplicate(linkedin_posts)
-            results["linkedin"] = len(new_linkedin)
-            self.data["posts"].extend(new_linkedin)
-        else:
+            return []
+
+        print("\n📘 Fetching Facebook/Instagram...")
+        return self.meta.fetch_all_pages(config.META_PAGES)
+
+    def _fetch_linkedin(self) -> List[Dict]:
+        """Fetch LinkedIn company posts."""
+        if not self.linkedin.is_configured():
             print("\n⚠️  LinkedIn: Not configured (add access_token to config)")
-            results["linkedin"] = 0
+            return []
+
+        print("\n💼 Fetching LinkedIn...")
+        return self.linkedin.fetch_all_companies(config.LINKEDIN_COMPANIES)
+
+    def _run_stages(self, stages: Dict[str, Callable[[], List[Dict]]]) -> Dict[str, List[Dict]]:
+        """
+        Run platform fetch stages, concurrently unless PARALLEL_FETCH is off.
+
+        Each stage's output is printed in one block when it completes. A
+        stage that exceeds its PLATFORM_TIMEOUTS entry is abandoned and
+        contributes no posts to this cycle; it is skipped in later cycles
+        until it finishes, and its posts are then added to the next cycle's
+        (see also finish_abandoned_stages()).
+
+        Returns:
+            Posts per platform, in the order the stages were given
+        """
+        if not getattr(config, "PARALLEL_FETCH", True):
+            return {platform: stage() for platform, stage in stages.items()}
+
+        timeouts = getattr(config, "PLATFORM_TIMEOUTS", {})
+        started = time.monotonic()
+        futures: Dict[str, Future] = {}
+        late: Dict[str, List[Dict]] = {}
+
+        executor = ThreadPoolExecutor(max_workers=len(stages), thread_name_prefix="fetch")
+        try:
+            for platform, stage in stages.items():
+                previous = self._running_stages.get(platform)
+                if previous is not None and not previous.done():
+                    print(f"\n⚠️  {platform.capitalize()}: previous fetch still running - skipping")
+                    continue
+                abandoned = self._abandoned_stages.pop(platform, None)
+                if abandoned is not None:
+                    late[platform] = self._late_stage_result(platform, abandoned)
+                futures[platform] = self._running_stages[platform] = executor.submit(_buffered_stage(stage))
+
+            collected = {}
+            for platform in stages:
+                future = futures.get(platform)
+                if future is None:
+                    collected[platform] = []
+                    continue
+                collected[platform] = late.get(platform, [])
+
+                timeout = timeouts.get(platform)
+                remaining = None if timeout is None else max(0, started + timeout - time.monotonic())
+                try:
+                    collected[platform] = collected[platform] + future.result(timeout=remaining)
+                except FuturesTimeoutError:
+                    future.cancel()
+                    self._abandoned_stages[platform] = future
+                    print(f"\n⏱️  {platform.capitalize()}: timed out after {timeout}s - "
+                          "its posts will be added once it finishes")
+                except Exception as e:
+                    print(f"\n❌ {platform.capitalize()}: fetch failed: {e}")
+        finally:
+            # Don't wait for abandoned stages; they finish in the background
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return collected
+
+    def _late_stage_result(self, platform: str, future: Future) -> List[Dict]:
+        """Posts of a finished stage that timed out in an earlier cycle."""
+        try:
+            posts = future.result()
+        except Exception as e:
+            print(f"\n❌ {platform.capitalize()}: earlier timed-out fetch failed: {e}")
+            return []
+        print(f"\n📥 {platform.capitalize()}: {len(posts)} posts from the earlier timed-out fetch")
+        return posts
+
+    def finish_abandoned_stages(self) -> Dict[str, int]:
+        """
+        Wait for stages that timed out, then store their posts.
+
+        For single runs, which have no next cycle to collect them in.
+
+        Returns:
+            Dictionary with count of new posts per platform
+        """
+        if not self._abandoned_stages:
+            return {}
+
+        print("\n⏳ Waiting for timed-out fetches so their posts are stored...")
+        results = {}
+        for platform, future in list(self._abandoned_stages.items()):
+            new_posts = self._deduplicate(self._late_stage_result(platform, future))
+            results[platform] = len(new_posts)
+            self._add_posts(new_posts)
+        self._abandoned_stages.clear()
+
+        self._trim_old_posts()
+        self._update_stats()
+        self._save_data()
+        self._commit_monitor_state()
+
+        return results
+
+    def fetch_all(self) -> Dict[str, int]:
+        """
+        Fetch posts from all configured platforms.
+
+        Platforms are fetched concurrently; their posts are then
+        deduplicated and added here, one platform at a time in a fixed
+        order, so the store has a single writer.
+
+        Returns:
+            Dictionary with count of new posts per platform
+        """
+        results = {}
+
+        fetched = self._run_stages({
+            "youtube": self._fetch_youtube,
+            "twitter": self._fetch_twitter,
+            "meta": self._fetch_meta,
+            "linkedin": self._fetch_linkedin,
+        })
 
         # Manual entries
-        manual_entries = self.manual.get_all_entries()
-        new_manual = self._deduplicate(manual_entries)
-        results["manual"] = len(new_manual)
-        self.data["posts"].extend(new_manual)
+        fetched["manual"] = self.manual.get_all_entries()
+
+        for platform, posts in fetched.items():
+            new_posts = self._deduplicate(posts)
+            results[platform] = len(new_posts)
+            self._add_posts(new_posts)
 
         # Trim and save
         self._trim_old_posts()
         self._update_stats()
         self._save_data()
+        self._commit_monitor_state()
 
         return results
 
+    def _commit_monitor_state(self):
+        """
+        Persist the cursors and watermarks that monitors advanced while
+        fetching, now that the posts they cover are stored.
+
+        State of a platform whose fetch is still running is kept back
+        until a later cycle has stored its posts.
+        """
+        monitors = {
+            "twitter": [self.twitter, self.grok],
+            "meta": [self.meta],
+            "linkedin": [self.linkedin],
+        }
+        for platform, platform_monitors in monitors.items():
+            running = self._running_stages.get(platform)
+            if running is not None and not running.done():
+                continue
+            if platform in self._abandoned_stages:
+                continue
+            for monitor in platform_monitors:
+                monitor.commit_state()
+
     def _update_stats(self):
         """Calculate and update statistics."""
         posts = self.data["posts"]
@@ -278,11 +478,16 @@ def main():
     parser.add_argument("--watch", action="store_true", help="Continuous monitoring mode")
     parser.add_argument("--add", action="store_true", help="Add manual entry")
     parser.add_argument("--dashboard", action="store_true", help="Only regenerate dashboard")
+    parser.add_argument("--backfill", action="store_true",
+                       help="On the first fetch, search Grok's full window and every page of Meta "
+                            "posts instead of resuming where the last fetch stopped "
+                            "(Twitter API cursors and LinkedIn last-seen posts still apply)")
     parser.add_argument("--interval", type=int, default=config.CHECK_INTERVAL,
                        help="Check interval in minutes (for --watch mode)")
     args = parser.parse_args()
 
     listener = SocialMediaListener()
+    listener.grok.backfill = listener.meta.backfill = args.backfill
 
     if args.add:
         # Interactive manual entry
@@ -290,7 +495,8 @@ def main():
         interactive_add()
         print("\nRegenerating dashboard...")
         listener.data = listener._load_data()
-        listener.data["posts"].extend(listener.manual.get_all_entries())
+        listener.manual = ManualEntryManager()
+        listener._add_posts(listener._deduplicate(listener.manual.get_all_entries()))
         listener._update_stats()
         listener._save_data()
         dashboard_path = listener.generate_report()
@@ -306,13 +512,13 @@ def main():
 
     elif args.watch:
         # Continuous monitoring
-        import time
         print(f"🔄 Starting continuous monitoring (every {args.interval} minutes)")
         print("Press Ctrl+C to stop\n")
 
         try:
             while True:
                 results = listener.fetch_all()
+                listener.grok.backfill = listener.meta.backfill = False
                 listener.print_summary(results)
                 dashboard_path = listener.generate_report()
                 print(f"✅ Dashboard updated: {dashboard_path}")
@@ -328,6 +534,8 @@ def main():
         print("🚀 Social Media Listener")
         print("=" * 50)
         results = listener.fetch_all()
+        for platform, count in listener.finish_abandoned_stages().items():
+            results[platform] += count
         listener.print_summary(results)
         dashboard_path = listener.generate_report()
         print(f"\n✅ Dashboard generated: {dashboard_path}")
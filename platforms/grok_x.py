@@ -9,10 +9,13 @@ social media monitoring without needing separate Twitter API access.
 """
 
 import os
-import json
+import hashlib
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import Any, Callable, List, Dict, Optional, Tuple
 
 try:
     from xai_sdk import Client
@@ -22,22 +25,201 @@ try:
 except ImportError:
     XAI_SDK_AVAILABLE = False
 
+from .json_stream import JsonObjectScanner
+from .state import ExpiringCache, StateFile
+from .usage import UsageLedger
+
+
+DEFAULT_MODEL = "grok-4-fast"
+
+# Searches run at the same time, and seconds allowed per search
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_CALL_TIMEOUT = 120
+
+# Seconds a cached search result is reused, and results kept
+DEFAULT_CACHE_TTL = 1800
+DEFAULT_CACHE_MAX_ENTRIES = 500
+
+# Minutes each incremental search reaches back before the last success,
+# for posts that x_search indexes late
+DEFAULT_WINDOW_OVERLAP = 60
+
+# Keywords asked for in one prompt at most, the response tokens a batch
+# should stay under, and the tokens per returned post assumed until
+# responses have been measured
+DEFAULT_KEYWORD_BATCH_SIZE = 1
+DEFAULT_BATCH_TOKEN_BUDGET = 8000
+ESTIMATED_TOKENS_PER_POST = 120
+
+# Tokens a search is assumed to use before the ledger has measured it
+ESTIMATED_TOKENS_PER_SEARCH = 5000
+
+
+# Key for content-derived post IDs; changing it changes every such ID
+CONTENT_ID_KEY = b"social-spy/grok-post/v1"
+
+
+class BudgetSkipped(Exception):
+    """A search was not run because it would exceed the token budget."""
+
+
+def content_id(author: str, text: str, published: str) -> str:
+    """
+    Stable ID for a post without a status URL.
+
+    Derived from the author, the text with whitespace and case normalized,
+    and the publication date, so the same post gets the same ID in every
+    process and on every fetch.
+    """
+    normalized = "\x1f".join([
+        author.strip().lstrip("@").lower(),
+        " ".join(text.split()).casefold(),
+        published[:10],
+    ])
+    digest = hashlib.blake2b(normalized.encode("utf-8"), key=CONTENT_ID_KEY, digest_size=10)
+    return f"c{digest.hexdigest()}"
+
+
+def _post_content_id(post: Dict) -> str:
+    return content_id(
+        post.get("author_username") or post.get("author") or "",
+        post.get("text", ""),
+        post.get("published", ""),
+    )
+
+
+def _has_status_id(post: Dict) -> bool:
+    """Whether a post's ID is an X status ID rather than a generated one."""
+    post_id = str(post.get("id", ""))
+    if not post_id.isdigit():
+        return False
+    # Old hash fallbacks were up to 12 digits; status IDs are far longer
+    if len(post_id) >= 15:
+        return True
+    id_match = re.search(r"/status/(\d+)", post.get("url", ""))
+    return bool(id_match and id_match.group(1) == post_id)
+
+
+def migrate_content_ids(posts: List[Dict]) -> Tuple[List[Dict], List[Tuple[str, str]]]:
+    """
+    Store migration giving Grok posts without a status ID their content ID.
+
+    Earlier versions used Python's per-process string hash, so the same
+    post was stored again after every restart. Those IDs are often all
+    digits too, so only IDs confirmed by length or the post URL count as
+    status IDs. Posts that share a content ID are collapsed into the first
+    one fetched.
+
+    Returns:
+        Posts to add and (platform, id) keys to remove
+    """
+    groups: Dict[str, List[Dict]] = {}
+    for post in posts:
+        if post.get("source") != "grok" or _has_status_id(post):
+            continue
+        groups.setdefault(_post_content_id(post), []).append(post)
+
+    added, removed = [], []
+    for new_id, duplicates in groups.items():
+        keep = min(duplicates, key=lambda post: post.get("fetched_at", ""))
+        if not any(str(post.get("id")) == new_id for post in duplicates):
+            added.append(dict(keep, id=new_id))
+        removed.extend(
+            (post.get("platform", ""), str(post.get("id", "")))
+            for post in duplicates if str(post.get("id")) != new_id
+        )
+
+    return added, removed
+
 
 class GrokXMonitor:
     """Monitor X/Twitter using Grok's x_search capability."""
 
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        call_timeout: float = DEFAULT_CALL_TIMEOUT,
+        model: str = DEFAULT_MODEL,
+        cache_file: Optional[str] = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        cache_max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        watermark_file: Optional[str] = None,
+        window_overlap: float = DEFAULT_WINDOW_OVERLAP,
+        backfill: bool = False,
+        stream: bool = False,
+        keyword_batch_size: int = DEFAULT_KEYWORD_BATCH_SIZE,
+        batch_token_budget: int = DEFAULT_BATCH_TOKEN_BUDGET,
+        ledger_file: Optional[str] = None,
+        cycle_token_budget: int = 0,
+        daily_token_budget: int = 0,
+        token_prices: Optional[Dict[str, float]] = None,
+        on_post: Optional[Callable[[str, Tuple[str, ...], Dict], None]] = None,
+    ):
         """
         Initialize the Grok X monitor.
 
         Args:
             api_key: xAI API key from console.x.ai
+            max_concurrency: Keyword/account searches run at the same time
+                (1 runs them one after another)
+            call_timeout: Seconds allowed for a single search
+            model: Grok model used for searches
+            cache_file: Optional path to persist parsed search results, so
+                the same search within cache_ttl is not paid for again
+            cache_ttl: Seconds a cached search result is reused
+            cache_max_entries: Cached searches kept (least recently used go first)
+            watermark_file: Optional path to persist when each keyword and
+                account was last searched successfully, so later searches
+                only cover the time since then
+            window_overlap: Minutes each incremental search reaches back
+                before the last success
+            backfill: Ignore the last successes and search full windows
+            stream: Stream responses and parse posts as they arrive
+            keyword_batch_size: Keywords searched in one prompt at most
+                (1 searches each keyword on its own)
+            batch_token_budget: Response tokens a keyword batch should stay
+                under; batches shrink when posts turn out to be longer
+            ledger_file: Optional path to record tokens, latency and posts
+                per call and target
+            cycle_token_budget: Tokens a fetch cycle may spend (0 = no limit)
+            daily_token_budget: Tokens a day may spend, as recorded in the
+                ledger (0 = no limit); ignored without a ledger_file
+            token_prices: USD per million 'input' and 'output' tokens, for
+                cost reporting
+            on_post: Optional callback(kind, group, post) for each post as
+                soon as it is parsed (with stream, as its JSON object
+                closes), before caching and keyword attribution; called
+                from the search's worker thread
         """
         self.api_key = api_key
+        self.max_concurrency = max(1, max_concurrency)
+        self.call_timeout = call_timeout
+        self.model = model
+        self.cache = ExpiringCache(cache_file, cache_ttl, cache_max_entries) if cache_file else None
+        self.watermarks = StateFile(watermark_file) if watermark_file else None
+        self.window_overlap = window_overlap
+        self.backfill = backfill
+        self.stream = stream
+        self.keyword_batch_size = max(1, keyword_batch_size)
+        self.batch_token_budget = batch_token_budget
+        # Running average of response tokens per post
+        self._tokens_per_post = float(ESTIMATED_TOKENS_PER_POST)
+
+        self.ledger = UsageLedger(ledger_file) if ledger_file else None
+        if daily_token_budget and not self.ledger:
+            print("⚠️  Grok daily_token_budget needs a ledger_file to track the day's usage - ignoring it")
+            daily_token_budget = 0
+        self.cycle_token_budget = cycle_token_budget
+        self.daily_token_budget = daily_token_budget
+        self.token_prices = token_prices or {}
+        self.on_post = on_post
+        self._usage_lock = threading.Lock()
+        self.cycle_usage = {"prompt_tokens": 0, "completion_tokens": 0, "calls": 0}
         self.client = None
 
         if XAI_SDK_AVAILABLE and api_key:
-            self.client = Client(api_key=api_key)
+            self.client = Client(api_key=api_key, timeout=call_timeout)
 
     def is_configured(self) -> bool:
         """Check if API credentials are configured."""
@@ -55,33 +237,166 @@ class GrokXMonitor:
         Returns:
             List of parsed post dictionaries
         """
+        return self._posts_from_objects(JsonObjectScanner().feed(response_text))
+
+    def _posts_from_objects(self, objects: List[Dict[str, Any]]) -> List[Dict]:
+        """
+        Normalize JSON objects found in a response into posts.
+
+        Objects that are not posts themselves (e.g. {"posts": [...]}) are
+        searched one level down for lists of posts.
+        """
         posts = []
+        for item in objects:
+            post = self._normalize_post(item)
+            if post:
+                posts.append(post)
+                continue
 
-        # Try to extract JSON array from response
-        json_match = re.search(r'\[\s*\{.*?\}\s*\]', response_text, re.DOTALL)
-        if json_match:
-            try:
-                parsed = json.loads(json_match.group())
-                for item in parsed:
-                    post = self._normalize_post(item)
-                    if post:
-                        posts.append(post)
-                return posts
-            except json.JSONDecodeError:
-                pass
-
-        # Fallback: parse individual JSON objects
-        json_objects = re.findall(r'\{[^{}]*"(?:text|content|tweet)"[^{}]*\}', response_text, re.DOTALL)
-        for obj_str in json_objects:
-            try:
-                item = json.loads(obj_str)
-                post = self._normalize_post(item)
-                if post:
+            for value in item.values():
+                if isinstance(value, list):
+                    for nested in value:
+                        post = self._normalize_post(nested) if isinstance(nested, dict) else None
+                        if post:
+                            posts.append(post)
+
+        return posts
+
+    def _complete(self, chat, kind: str, group: Tuple[str, ...]) -> List[Dict]:
+        """
+        Get the posts from a chat's response, streamed if enabled, handing
+        each to on_post as it arrives, and account for the call's usage.
+        """
+        started = time.monotonic()
+        posts = []
+        if self.stream:
+            # Each post is handed on as soon as its object closes
+            scanner = JsonObjectScanner()
+            response = None
+            for response, chunk in chat.stream():
+                for post in self._posts_from_objects(scanner.feed(chunk.content)):
+                    if self.on_post:
+                        self.on_post(kind, group, post)
                     posts.append(post)
-            except json.JSONDecodeError:
+        else:
+            response = chat.sample()
+            response_text = response.content if hasattr(response, 'content') else str(response)
+            for post in self._parse_posts_from_response(response_text):
+                if self.on_post:
+                    self.on_post(kind, group, post)
+                posts.append(post)
+
+        self._measure_response(response, len(posts))
+        self._record_usage(response, kind, group, posts, time.monotonic() - started)
+        return posts
+
+    def _record_usage(self, response: Any, kind: str, group: Tuple[str, ...], posts: List[Dict], latency: float):
+        """Add a call's tokens to the cycle totals and to the ledger."""
+        usage = getattr(response, "usage", None)
+        prompt_tokens = int(getattr(usage, "prompt_tokens", 0) or 0)
+        completion_tokens = int(getattr(usage, "completion_tokens", 0) or 0)
+
+        with self._usage_lock:
+            self.cycle_usage["prompt_tokens"] += prompt_tokens
+            self.cycle_usage["completion_tokens"] += completion_tokens
+            self.cycle_usage["calls"] += 1
+
+        if not self.ledger:
+            return
+
+        # A batch's tokens are shared evenly; posts count for the keywords they matched
+        for target in group:
+            if len(group) == 1:
+                yielded = len(posts)
+            else:
+                yielded = sum(
+                    1 for post in posts
+                    if target.lower() in {k.lower() for k in post.get("matched_keywords", [])}
+                )
+            self.ledger.record(
+                f"{kind}:{target.lower()}",
+                prompt_tokens // len(group),
+                completion_tokens // len(group),
+                latency / len(group),
+                yielded,
+            )
+
+    def begin_cycle(self):
+        """Start a new fetch cycle: reset the cycle's usage and budget."""
+        with self._usage_lock:
+            self.cycle_usage = {"prompt_tokens": 0, "completion_tokens": 0, "calls": 0}
+
+    def commit_state(self):
+        """Persist the search watermarks advanced this cycle; call once the posts are stored."""
+        if self.watermarks:
+            self.watermarks.commit_staged()
+
+    def cycle_cost(self) -> float:
+        """Estimated USD cost of the current cycle, from token_prices."""
+        return (
+            self.cycle_usage["prompt_tokens"] * self.token_prices.get("input", 0)
+            + self.cycle_usage["completion_tokens"] * self.token_prices.get("output", 0)
+        ) / 1_000_000
+
+    def efficiency(self, kind: str, target: str) -> Optional[float]:
+        """Posts per 1,000 tokens for a keyword or account, from the ledger."""
+        return self.ledger.efficiency(f"{kind}:{target.lower()}") if self.ledger else None
+
+    def _within_budget(self, searches: List[Tuple[str, Tuple[str, ...]]]) -> List[bool]:
+        """
+        Decide which searches fit in the remaining cycle and daily budgets.
+
+        Account and keyword searches are ranked together, highest-yield
+        first (targets without history first of all, so they get
+        measured), using each target's average tokens per call from the
+        ledger as its expected cost.
+
+        Args:
+            searches: (kind, group) per search
+
+        Returns:
+            Per search, whether it may run
+        """
+        if not self.cycle_token_budget and not self.daily_token_budget:
+            return [True] * len(searches)
+
+        def expected_cost(kind, group):
+            if not self.ledger:
+                return ESTIMATED_TOKENS_PER_SEARCH
+            costs = [self.ledger.tokens_per_call(f"{kind}:{target.lower()}") for target in group]
+            if None in costs:
+                return ESTIMATED_TOKENS_PER_SEARCH
+            return sum(costs)
+
+        def priority(position):
+            kind, group = searches[position]
+            yields = [self.efficiency(kind, target) for target in group]
+            return float("inf") if None in yields else sum(yields) / len(yields)
+
+        spent = self.cycle_usage["prompt_tokens"] + self.cycle_usage["completion_tokens"]
+        # Only set with a ledger (see __init__), which holds the day's usage
+        spent_today = self.ledger.daily_tokens() if self.daily_token_budget else 0
+
+        admitted = [False] * len(searches)
+        for position in sorted(range(len(searches)), key=priority, reverse=True):
+            cost = expected_cost(*searches[position])
+            if self.cycle_token_budget and spent + cost > self.cycle_token_budget:
+                continue
+            if self.daily_token_budget and spent_today + cost > self.daily_token_budget:
                 continue
+            admitted[position] = True
+            spent += cost
+            spent_today += cost
 
-        return posts
+        return admitted
+
+    def _measure_response(self, response: Any, post_count: int):
+        """Update the tokens-per-post average used to size keyword batches."""
+        if not post_count or response is None:
+            return
+        usage = getattr(response, "usage", None)
+        tokens = getattr(usage, "completion_tokens", 0) or len(getattr(response, "content", "")) / 4
+        self._tokens_per_post = 0.7 * self._tokens_per_post + 0.3 * (tokens / post_count)
 
     def _normalize_post(self, item: Dict) -> Optional[Dict]:
         """
@@ -114,9 +429,6 @@ class GrokXMonitor:
             id_match = re.search(r'/status/(\d+)', url)
             if id_match:
                 post_id = id_match.group(1)
-        if not post_id:
-            # Generate a hash-based ID as fallback
-            post_id = str(hash(text))[:12]
 
         # Extract author info
         author = (
@@ -139,7 +451,7 @@ class GrokXMonitor:
         # Extract timestamp
         published = item.get("published") or item.get("date") or item.get("created_at") or ""
 
-        return {
+        post = {
             "platform": "twitter",
             "type": "tweet",
             "id": str(post_id),
@@ -155,6 +467,63 @@ class GrokXMonitor:
             "fetched_at": datetime.now().isoformat(),
             "source": "grok",
         }
+        if not post_id:
+            # Derive a stable ID from the content as fallback
+            post["id"] = _post_content_id(post)
+
+        # Keywords the post matched, from batched searches
+        keywords = item.get("keywords")
+        if isinstance(keywords, list):
+            post["matched_keywords"] = [str(keyword) for keyword in keywords]
+
+        return post
+
+    def search(
+        self,
+        accounts: List[str],
+        keywords: List[str],
+        max_per_account: int = 10,
+        max_per_keyword: int = 20,
+        days_back: int = 7
+    ) -> List[Dict]:
+        """
+        Get recent posts from X accounts and search X for keywords, with
+        all of their searches sharing one pool of max_concurrency workers.
+
+        With keyword_batch_size above 1, several keywords are asked for in
+        one prompt and each post carries the keywords it matched in
+        'matched_keywords' ('matched_keyword' is the first of them).
+
+        Args:
+            accounts: Usernames to monitor (with or without @)
+            keywords: Keywords to search
+            max_per_account: Maximum posts per account
+            max_per_keyword: Maximum posts per keyword
+            days_back: How many days back to search
+
+        Returns:
+            The accounts' posts followed by the keywords' posts
+        """
+        if not self.is_configured():
+            print("⚠️  Grok API not configured - skipping X search")
+            return []
+
+        accounts = [account.lstrip("@") for account in accounts]
+        searches = [("account", (account,), max_per_account, days_back) for account in accounts]
+        searches += [
+            ("keyword", group, max_per_keyword, days_back)
+            for group in self._keyword_groups(keywords, max_per_keyword, days_back)
+        ]
+
+        results = self._run_searches(searches)
+
+        account_results = results[:len(accounts)]
+        keyword_results = results[len(accounts):]
+        keyword_groups = [group for _, group, _, _ in searches[len(accounts):]]
+        return (
+            self._merge_account_results(accounts, account_results)
+            + self._merge_keyword_results(keyword_groups, keyword_results)
+        )
 
     def search_keywords(
         self,
@@ -163,7 +532,7 @@ class GrokXMonitor:
         days_back: int = 7
     ) -> List[Dict]:
         """
-        Search X for posts matching keywords using Grok.
+        Search X for posts matching keywords using Grok; see search().
 
         Args:
             keywords: List of keywords to search
@@ -173,36 +542,313 @@ class GrokXMonitor:
         Returns:
             List of post dictionaries
         """
-        if not self.is_configured():
-            print("⚠️  Grok API not configured - skipping X search")
-            return []
+        return self.search([], keywords, max_per_keyword=max_results, days_back=days_back)
+
+    def search_accounts(
+        self,
+        accounts: List[str],
+        max_results: int = 10
+    ) -> List[Dict]:
+        """
+        Get recent posts from specific X accounts; see search().
+
+        Args:
+            accounts: List of usernames to monitor (with or without @)
+            max_results: Maximum posts per account
+
+        Returns:
+            List of post dictionaries
+        """
+        return self.search(accounts, [], max_per_account=max_results)
 
+    def _keyword_groups(self, keywords: List[str], max_results: int, days_back: int) -> List[Tuple[str, ...]]:
+        """
+        Keywords searched together, in keyword order. Cached keywords are
+        replayed on their own, so only the rest are batched; batch sizes
+        vary with the running token averages.
+        """
+        uncached = [
+            keyword for keyword in keywords
+            if not self._is_cached("keyword", keyword, max_results, days_back)
+        ]
+        groups = [(keyword,) for keyword in keywords if keyword not in uncached]
+        groups += self._plan_keyword_batches(uncached, max_results)
+        order = {}
+        for position, keyword in enumerate(keywords):
+            order.setdefault(keyword, position)
+        groups.sort(key=lambda group: order[group[0]])
+        return groups
+
+    def _merge_account_results(self, accounts: List[str], results: List) -> List[Dict]:
+        """Report each account's search and combine their posts, each post once."""
         all_posts = []
         seen_ids = set()
 
-        # Calculate date range (must be datetime objects, not strings)
-        from_date = datetime.now() - timedelta(days=days_back)
-        to_date = datetime.now()
+        for account, posts in zip(accounts, results):
+            print(f"🤖 Grok fetching X account: @{account}...")
+            if isinstance(posts, BudgetSkipped):
+                print(f"   ⏭️  Skipped: {posts}")
+                continue
+            if isinstance(posts, Exception):
+                print(f"   ❌ Error fetching @{account}: {posts}")
+                continue
 
-        for keyword in keywords:
-            print(f"🤖 Grok searching X for: {keyword}...")
+            for post in posts:
+                if post["id"] not in seen_ids:
+                    all_posts.append(post)
+                    seen_ids.add(post["id"])
 
-            try:
-                posts = self._search_single_keyword(keyword, max_results, from_date, to_date)
+            print(f"   Found {len(posts)} posts")
 
-                for post in posts:
-                    if post["id"] not in seen_ids:
-                        post["matched_keyword"] = keyword
-                        all_posts.append(post)
-                        seen_ids.add(post["id"])
+        return all_posts
+
+    def _merge_keyword_results(self, groups: List[Tuple[str, ...]], results: List) -> List[Dict]:
+        """Report each keyword search and combine their posts, attributing keywords."""
+        all_posts = []
+        seen: Dict[str, Dict] = {}
 
-                print(f"   Found {len(posts)} posts")
+        for group, posts in zip(groups, results):
+            label = ", ".join(group)
+            print(f"🤖 Grok searching X for: {label}...")
+            if isinstance(posts, BudgetSkipped):
+                print(f"   ⏭️  Skipped: {posts}")
+                continue
+            if isinstance(posts, Exception):
+                print(f"   ❌ Error searching for '{label}': {posts}")
+                continue
 
-            except Exception as e:
-                print(f"   ❌ Error searching for '{keyword}': {e}")
+            for post in posts:
+                matched = self._attribute_keywords(post, group)
+                existing = seen.get(post["id"])
+                if existing is not None:
+                    # Found again by another batch; only add its keywords
+                    if matched:
+                        existing.setdefault("matched_keyword", matched[0])
+                        existing["matched_keywords"] = existing.get("matched_keywords", []) + matched
+                    continue
+
+                post.pop("matched_keywords", None)
+                if matched:
+                    post["matched_keyword"] = matched[0]
+                    if self.keyword_batch_size > 1:
+                        post["matched_keywords"] = matched
+                all_posts.append(post)
+                seen[post["id"]] = post
+
+            print(f"   Found {len(posts)} posts")
 
         return all_posts
 
+    def _plan_keyword_batches(self, keywords: List[str], max_results: int) -> List[Tuple[str, ...]]:
+        """
+        Split keywords into batches whose expected response stays within
+        batch_token_budget, with at most keyword_batch_size keywords each.
+        """
+        tokens_per_keyword = max_results * self._tokens_per_post
+        size = int(self.batch_token_budget // tokens_per_keyword) if tokens_per_keyword else 1
+        size = max(1, min(self.keyword_batch_size, size))
+        return [tuple(keywords[i:i + size]) for i in range(0, len(keywords), size)]
+
+    @staticmethod
+    def _attribute_keywords(post: Dict, group: Tuple[str, ...]) -> List[str]:
+        """
+        Keywords of a search that a post matched: the searched keyword for a
+        single search; for a batch, the keywords Grok reported for the post,
+        or else those found in its text.
+        """
+        if len(group) == 1:
+            return list(group)
+
+        claimed = {keyword.lower() for keyword in post.get("matched_keywords", [])}
+        matched = [keyword for keyword in group if keyword.lower() in claimed]
+        if matched:
+            return matched
+
+        text = post.get("text", "")
+        return [
+            keyword for keyword in group
+            if re.search(r"(?<!\w)" + re.escape(keyword) + r"(?!\w)", text, re.IGNORECASE)
+        ]
+
+    def _cache_key(self, kind: str, target: str, max_results: int, days_back: int) -> str:
+        """Cache key of a target's results; the time bucket rolls over every cache_ttl."""
+        bucket = int(time.time() // self.cache.ttl) if self.cache.ttl else 0
+        mode = "backfill" if self.backfill else "incremental"
+        return f"{self.model}|{kind}|{target.lower()}|{max_results}:{days_back}d:{mode}|{bucket}"
+
+    def _is_cached(self, kind: str, target: str, max_results: int, days_back: int) -> bool:
+        """Whether a target has cached results."""
+        return bool(self.cache) and self.cache.get(self._cache_key(kind, target, max_results, days_back)) is not None
+
+    def _cached_results(self, keys: List[str]) -> Optional[List[Dict]]:
+        """A group's posts if all of its targets are cached, each post once."""
+        cached = [self.cache.get(key) for key in keys]
+        if any(posts is None for posts in cached):
+            return None
+        if len(cached) == 1:
+            return cached[0]
+
+        merged: Dict[str, Dict] = {}
+        for posts in cached:
+            for post in posts:
+                existing = merged.get(post["id"])
+                if existing is None:
+                    merged[post["id"]] = dict(post)
+                else:
+                    existing["matched_keywords"] = (
+                        existing.get("matched_keywords", []) + post.get("matched_keywords", [])
+                    )
+        return list(merged.values())
+
+    def _posts_for_target(self, posts: List[Dict], target: str, group: Tuple[str, ...]) -> List[Dict]:
+        """The part of a group's results to cache for one of its targets."""
+        if len(group) == 1:
+            return posts
+        # Only keyword searches are batched
+        return [
+            dict(post, matched_keywords=[target]) for post in posts
+            if target in self._attribute_keywords(post, group)
+        ]
+
+    def _window_start(self, kind: str, group: Tuple[str, ...], days_back: int, now: datetime) -> datetime:
+        """
+        Start of the search window for a group of targets: the earliest of
+        their last successful searches minus the overlap, but never more
+        than days_back ago.
+        """
+        earliest = now - timedelta(days=days_back)
+        if self.watermarks is None or self.backfill:
+            return earliest
+
+        starts = []
+        for target in group:
+            last_success = self.watermarks.get(f"{kind}:{target.lower()}")
+            if not last_success:
+                return earliest
+            starts.append(datetime.fromisoformat(last_success) - timedelta(minutes=self.window_overlap))
+        return max(earliest, min(starts))
+
+    def _run_searches(self, searches: List[Tuple[str, Tuple[str, ...], int, int]]) -> List:
+        """
+        Run every search, up to max_concurrency at once.
+
+        Results are cached per target, so a group whose targets are all
+        cached is not searched again however targets were grouped; each
+        search only covers the time since its targets' last successful
+        search (see _window_start). Each search gets call_timeout seconds
+        once a worker is free for it. Results come back in search order
+        whatever order the searches finish in, so merging them is
+        deterministic.
+
+        Args:
+            searches: (kind, group, max_results, days_back) per search, where
+                kind is 'keyword' or 'account', group the keywords or
+                accounts searched together (usually one), max_results the
+                result limit (part of the cache key) and days_back the
+                longest window to search
+
+        Returns:
+            Per search, its posts or the exception that ended it
+        """
+        keys = [
+            [self._cache_key(kind, target, max_results, days_back) for target in group] if self.cache else None
+            for kind, group, max_results, days_back in searches
+        ]
+        results = [self._cached_results(group_keys) if group_keys else None for group_keys in keys]
+        missing = [position for position, posts in enumerate(results) if posts is None]
+
+        admitted = self._within_budget([searches[position][:2] for position in missing])
+        for position, admit in zip(list(missing), admitted):
+            if not admit:
+                results[position] = BudgetSkipped("token budget reached")
+                missing.remove(position)
+
+        # Window dates must be datetime objects, not strings
+        now = datetime.now()
+        windows = {
+            position: self._window_start(searches[position][0], searches[position][1], searches[position][3], now)
+            for position in missing
+        }
+        fetched = self._execute(
+            missing,
+            lambda position: self._search_group(
+                searches[position][0], searches[position][1], searches[position][2], windows[position], now
+            ),
+        )
+
+        for position, posts in zip(missing, fetched):
+            results[position] = posts
+            if isinstance(posts, Exception):
+                continue
+            kind, group = searches[position][:2]
+            if self.cache:
+                for target, key in zip(group, keys[position]):
+                    self.cache.set(key, self._posts_for_target(posts, target, group))
+            if self.watermarks:
+                for target in group:
+                    self.watermarks.stage(f"{kind}:{target.lower()}", now.isoformat())
+
+        if self.ledger:
+            self.ledger.save()
+        if not self.cache:
+            return results
+        self.cache.save()
+
+        # Callers annotate posts, so never hand out the cached dicts
+        return [
+            posts if isinstance(posts, Exception) else [dict(post) for post in posts]
+            for posts in results
+        ]
+
+    def _search_group(
+        self,
+        kind: str,
+        group: Tuple[str, ...],
+        max_results: int,
+        from_date: datetime,
+        to_date: datetime
+    ) -> List[Dict]:
+        """Run one planned search: an account, a keyword or a keyword batch."""
+        if kind == "account":
+            return self._search_single_account(group[0], max_results, from_date, to_date)
+        if len(group) == 1:
+            return self._search_single_keyword(group[0], max_results, from_date, to_date)
+        return self._search_keyword_batch(list(group), max_results, from_date, to_date)
+
+    def _execute(self, targets: List, search: Callable[[Any], List[Dict]]) -> List:
+        """Run search(target) for every target; see _run_searches()."""
+        if self.max_concurrency == 1 or len(targets) <= 1:
+            results = []
+            for target in targets:
+                try:
+                    results.append(search(target))
+                except Exception as e:
+                    results.append(e)
+            return results
+
+        workers = min(self.max_concurrency, len(targets))
+        started = time.monotonic()
+        results = []
+
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="grok")
+        try:
+            futures = [executor.submit(search, target) for target in targets]
+            for position, future in enumerate(futures):
+                # Searches queued behind others get their share of time too
+                deadline = started + (position // workers + 1) * self.call_timeout
+                try:
+                    results.append(future.result(timeout=max(0, deadline - time.monotonic())))
+                except FuturesTimeoutError:
+                    future.cancel()
+                    results.append(TimeoutError(f"timed out after {self.call_timeout}s"))
+                except Exception as e:
+                    results.append(e)
+        finally:
+            # Don't wait for searches that timed out
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return results
+
     def _search_single_keyword(
         self,
         keyword: str,
@@ -224,14 +870,14 @@ class GrokXMonitor:
         """
         # Create a chat with x_search tool enabled
         chat = self.client.chat.create(
-            model="grok-4-fast",
+            model=self.model,
             tools=[
                 x_search(from_date=from_date, to_date=to_date),
             ],
         )
 
         # Craft prompt for structured output
-        prompt = f"""Search X (Twitter) for posts about "{keyword}" from the last week.
+        prompt = f"""Search X (Twitter) for posts about "{keyword}" posted since {from_date:%Y-%m-%d %H:%M}.
 
 Return the results as a JSON array with this exact format:
 [
@@ -251,51 +897,86 @@ Find up to {max_results} relevant posts. Only return the JSON array, no other te
 
         chat.append(user(prompt))
 
-        # Get response (non-streaming for simplicity)
-        response = chat.sample()
-        response_text = response.content if hasattr(response, 'content') else str(response)
-
-        return self._parse_posts_from_response(response_text)
+        return self._complete(chat, "keyword", (keyword,))
 
-    def search_accounts(
+    def _search_keyword_batch(
         self,
-        accounts: List[str],
-        max_results: int = 10
+        keywords: List[str],
+        max_results: int,
+        from_date: datetime,
+        to_date: datetime
     ) -> List[Dict]:
         """
-        Get recent posts from specific X accounts.
+        Search for several keywords on X in one prompt.
 
         Args:
-            accounts: List of usernames to monitor (with or without @)
-            max_results: Maximum posts per account
+            keywords: Search terms
+            max_results: Maximum results to return per keyword
+            from_date: Start datetime
+            to_date: End datetime
 
         Returns:
-            List of post dictionaries
+            List of post dictionaries, with the keywords Grok reported for
+            each post in 'matched_keywords'
         """
-        if not self.is_configured():
-            print("⚠️  Grok API not configured - skipping X account fetch")
-            return []
+        chat = self.client.chat.create(
+            model=self.model,
+            tools=[
+                x_search(from_date=from_date, to_date=to_date),
+            ],
+        )
 
-        all_posts = []
-        seen_ids = set()
+        keyword_list = "\n".join(f'- "{keyword}"' for keyword in keywords)
+        prompt = f"""Search X (Twitter) for posts about each of these keywords posted since {from_date:%Y-%m-%d %H:%M}:
+{keyword_list}
 
-        from_date = datetime.now() - timedelta(days=7)
-        to_date = datetime.now()
+Return the results as a single JSON array with this exact format:
+[
+  {{
+    "text": "the tweet text",
+    "url": "https://x.com/username/status/123",
+    "author": "Display Name",
+    "username": "handle",
+    "published": "2026-01-28T12:00:00Z",
+    "likes": 100,
+    "retweets": 50,
+    "replies": 25,
+    "keywords": ["the keyword(s) from the list above this post matches"]
+  }}
+]
 
-        for account in accounts:
-            # Clean up account name
-            account = account.lstrip("@")
-            print(f"🤖 Grok fetching X account: @{account}...")
+Find up to {max_results} relevant posts per keyword. List each post once. Only return the JSON array, no other text."""
 
-            try:
-                chat = self.client.chat.create(
-                    model="grok-4-fast",
-                    tools=[
-                        x_search(from_date=from_date, to_date=to_date),
-                    ],
-                )
+        chat.append(user(prompt))
+        return self._complete(chat, "keyword", tuple(keywords))
+
+    def _search_single_account(
+        self,
+        account: str,
+        max_results: int,
+        from_date: datetime,
+        to_date: datetime
+    ) -> List[Dict]:
+        """
+        Get recent posts from a single X account.
 
-                prompt = f"""Get the {max_results} most recent posts from X user @{account}.
+        Args:
+            account: Username without @
+            max_results: Maximum results to return
+            from_date: Start datetime
+            to_date: End datetime
+
+        Returns:
+            List of post dictionaries
+        """
+        chat = self.client.chat.create(
+            model=self.model,
+            tools=[
+                x_search(from_date=from_date, to_date=to_date),
+            ],
+        )
+
+        prompt = f"""Get the {max_results} most recent posts from X user @{account}.
 
 Return the results as a JSON array with this exact format:
 [
@@ -313,29 +994,31 @@ Return the results as a JSON array with this exact format:
 
 Only return the JSON array, no other text."""
 
-                chat.append(user(prompt))
-                response = chat.sample()
-                response_text = response.content if hasattr(response, 'content') else str(response)
-
-                posts = self._parse_posts_from_response(response_text)
-
-                for post in posts:
-                    if post["id"] not in seen_ids:
-                        all_posts.append(post)
-                        seen_ids.add(post["id"])
-
-                print(f"   Found {len(posts)} posts")
-
-            except Exception as e:
-                print(f"   ❌ Error fetching @{account}: {e}")
-
-        return all_posts
+        chat.append(user(prompt))
+        return self._complete(chat, "account", (account,))
 
 
 def create_monitor(config: Dict) -> GrokXMonitor:
     """Create a Grok X monitor from config."""
     api_key = config.get("api_key", "") or os.getenv("XAI_API_KEY", "")
-    return GrokXMonitor(api_key)
+    return GrokXMonitor(
+        api_key,
+        max_concurrency=config.get("max_concurrency", DEFAULT_MAX_CONCURRENCY),
+        call_timeout=config.get("call_timeout", DEFAULT_CALL_TIMEOUT),
+        model=config.get("model", DEFAULT_MODEL),
+        cache_file=config.get("cache_file") or None,
+        cache_ttl=config.get("cache_ttl", DEFAULT_CACHE_TTL),
+        cache_max_entries=config.get("cache_max_entries", DEFAULT_CACHE_MAX_ENTRIES),
+        watermark_file=config.get("watermark_file") or None,
+        window_overlap=config.get("window_overlap_minutes", DEFAULT_WINDOW_OVERLAP),
+        stream=config.get("stream", False),
+        keyword_batch_size=config.get("keyword_batch_size", DEFAULT_KEYWORD_BATCH_SIZE),
+        batch_token_budget=config.get("batch_token_budget", DEFAULT_BATCH_TOKEN_BUDGET),
+        ledger_file=config.get("ledger_file") or None,
+        cycle_token_budget=config.get("cycle_token_budget", 0),
+        daily_token_budget=config.get("daily_token_budget", 0),
+        token_prices=config.get("token_prices"),
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,206 @@
+"""
+Shared HTTP Client
+===================
+One pooled requests.Session shared by every platform monitor, so API
+calls reuse keep-alive connections instead of opening a new TCP/TLS
+connection each time.
+
+Every request gets connect/read timeouts, and 429/5xx responses and
+connection errors are retried with exponential backoff and jitter.
+Calls are paced by a RateLimiter fed from the responses' rate-limit
+headers (see rate_limit.py).
+"""
+
+import random
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .rate_limit import RateLimiter
+
+
+# Status codes worth retrying
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+class HttpClient:
+    """Pooled HTTP client with timeouts, retries and timing hooks."""
+
+    def __init__(
+        self,
+        connect_timeout: float = 5,
+        read_timeout: float = 30,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30,
+        pool_maxsize: int = 16,
+        respect_rate_limits: bool = True,
+        rate_limit_max_wait: float = 30,
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            connect_timeout: Default seconds to wait for a connection
+            read_timeout: Default seconds to wait between bytes of the response
+            max_retries: Retries after the first attempt for 429/5xx and connection errors
+            backoff_factor: Base delay in seconds; attempt n waits up to factor * 2**n
+            max_backoff: Upper bound for a single retry delay
+            pool_maxsize: Keep-alive connections kept per host
+            respect_rate_limits: Pace calls using rate-limit response headers
+            rate_limit_max_wait: Longest a call is held back for its rate limit;
+                longer waits raise RateLimited instead
+        """
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=pool_maxsize, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self.rate_limiter = RateLimiter(rate_limit_max_wait) if respect_rate_limits else None
+
+        self._hooks: List[Callable[[Dict], None]] = []
+
+        # Settings passed to configure(), used to detect reconfiguration
+        self.settings: Dict = {}
+
+    def add_timing_hook(self, hook: Callable[[Dict], None]):
+        """
+        Register a callback invoked after every attempt.
+
+        The callback receives a dict with 'method', 'url', 'status' (None on
+        connection errors), 'elapsed' (seconds), 'attempt' and 'error'.
+        """
+        self._hooks.append(hook)
+
+    def remove_timing_hook(self, hook: Callable[[Dict], None]):
+        """Unregister a callback added with add_timing_hook."""
+        if hook in self._hooks:
+            self._hooks.remove(hook)
+
+    def _emit(self, **timing):
+        for hook in list(self._hooks):
+            try:
+                hook(timing)
+            except Exception as e:
+                print(f"⚠️  HTTP timing hook failed: {e}")
+
+    def _backoff(self, attempt: int, response: Optional[requests.Response]) -> float:
+        """Delay before the next attempt: Retry-After if given, else jittered exponential."""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return min(float(retry_after), self.max_backoff)
+
+        # Full jitter keeps concurrent callers from retrying in lockstep
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * (2 ** attempt)))
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        timeout: Optional[Timeout] = None,
+        retries: Optional[int] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Send a request, retrying on 429/5xx and connection errors.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            timeout: Seconds, or a (connect, read) tuple; defaults to the client's
+            retries: Retries for this call; defaults to the client's max_retries
+            **kwargs: Passed to requests.Session.request (params, headers, data, ...)
+
+        Returns:
+            The final response, which may still be an error status
+
+        Raises:
+            RateLimited: If the endpoint's rate limit would delay the call
+                longer than rate_limit_max_wait
+            requests.RequestException: If the last attempt failed to connect or timed out
+        """
+        if timeout is None:
+            timeout = (self.connect_timeout, self.read_timeout)
+
+        max_retries = self.max_retries if retries is None else retries
+
+        attempt = 0
+        while True:
+            if self.rate_limiter:
+                self.rate_limiter.acquire(url)
+
+            started = time.monotonic()
+            response = None
+            try:
+                response = self.session.request(method, url, timeout=timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._emit(method=method, url=url, status=None,
+                           elapsed=time.monotonic() - started, attempt=attempt, error=str(e))
+                if attempt >= max_retries:
+                    raise
+            else:
+                self._emit(method=method, url=url, status=response.status_code,
+                           elapsed=time.monotonic() - started, attempt=attempt, error=None)
+                blocked = self.rate_limiter.update(url, response) if self.rate_limiter else False
+                if response.status_code not in RETRY_STATUSES or attempt >= max_retries:
+                    return response
+                if response.status_code == 429 and blocked:
+                    # The limiter waits for the reset (or defers) on the next attempt
+                    attempt += 1
+                    continue
+
+            time.sleep(self._backoff(attempt, response))
+            attempt += 1
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request (see request())."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """Send a POST request (see request())."""
+        return self.request("POST", url, **kwargs)
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def configure(**settings) -> HttpClient:
+    """
+    Replace the shared client with one built from the given settings.
+
+    The current client is kept if it was built from the same settings.
+
+    Args:
+        **settings: HttpClient keyword arguments
+
+    Returns:
+        The shared client
+    """
+    global _client
+    with _client_lock:
+        if _client is None or _client.settings != settings:
+            _client = HttpClient(**settings)
+            _client.settings = settings
+        return _client
+
+
+def get_client() -> HttpClient:
+    """Get the shared client, creating it with defaults if needed."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
@@ -0,0 +1,91 @@
+"""
+Incremental JSON Scanner
+=========================
+Pulls JSON objects out of text that arrives in pieces, such as a
+streamed model response that wraps a JSON array in prose or code
+fences.
+
+The scanner tracks string literals, escapes and brace depth, so braces
+and brackets inside strings or nested objects never end an object
+early. Every character is looked at once, however the text is split.
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+
+# Characters that can change the scanner's state
+_SPECIAL_RE = re.compile(r'[{}"\\]')
+
+
+class JsonObjectScanner:
+    """Emits each outermost JSON object in a text stream once it closes."""
+
+    def __init__(self):
+        self._depth = 0
+        self._in_string = False
+        # An escape at the end of the previous chunk skips this chunk's first character
+        self._skip_first = False
+        self._parts: List[str] = []
+
+    def feed(self, text: str) -> List[Dict[str, Any]]:
+        """
+        Scan the next piece of text.
+
+        Args:
+            text: The next chunk of the stream
+
+        Returns:
+            Objects completed in this chunk, in order; fragments that are not
+            valid JSON are dropped
+        """
+        objects = []
+        if not text:
+            # An empty chunk must not use up a pending escape
+            return objects
+
+        start: Optional[int] = 0 if self._depth else None
+        skip_to = 1 if self._skip_first else 0
+        self._skip_first = False
+
+        for match in _SPECIAL_RE.finditer(text):
+            position = match.start()
+            if position < skip_to:
+                continue
+            char = match.group()
+
+            if self._depth == 0:
+                # Outside objects only an opening brace matters
+                if char == "{":
+                    self._depth = 1
+                    start = position
+            elif self._in_string:
+                if char == "\\":
+                    skip_to = position + 2
+                    if skip_to > len(text):
+                        self._skip_first = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._parts.append(text[start:position + 1])
+                    raw = "".join(self._parts)
+                    self._parts = []
+                    start = None
+                    try:
+                        parsed = json.loads(raw)
+                    except ValueError:
+                        continue
+                    if isinstance(parsed, dict):
+                        objects.append(parsed)
+
+        if self._depth and start is not None:
+            self._parts.append(text[start:])
+
+        return objects
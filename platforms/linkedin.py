@@ -6,8 +6,41 @@ Requires API credentials from https://developer.linkedin.com/
 """
 
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
+
+from .http_client import HttpClient, get_client
+from .rate_limit import RateLimited
+from .state import ExpiringCache, StateFile
+
+
+# Seconds a resolved vanity name is remembered, and an unknown one
+DEFAULT_ORG_CACHE_TTL = 30 * 24 * 3600
+DEFAULT_ORG_CACHE_MISS_TTL = 24 * 3600
+
+# Companies fetched at once, and pages followed per company
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_MAX_PAGES = 5
+
+
+def _normalize_share(share: Dict) -> Dict:
+    """Convert a shares API element into a post dictionary."""
+    content = share.get("content", {})
+    text_content = share.get("text", {})
+
+    return {
+        "platform": "linkedin",
+        "type": "post",
+        "id": share.get("id", ""),
+        "text": text_content.get("text", ""),
+        "url": f"https://www.linkedin.com/feed/update/{share.get('activity', '')}",
+        "published": datetime.fromtimestamp(
+            share.get("created", {}).get("time", 0) / 1000
+        ).isoformat() if share.get("created", {}).get("time") else "",
+        "media_type": content.get("contentEntities", [{}])[0].get("entityType", ""),
+        "fetched_at": datetime.now().isoformat(),
+    }
 
 
 class LinkedInMonitor:
@@ -15,14 +48,42 @@ class LinkedInMonitor:
 
     API_URL = "https://api.linkedin.com/v2"
 
-    def __init__(self, access_token: str):
+    def __init__(
+        self,
+        access_token: str,
+        http: Optional[HttpClient] = None,
+        org_cache_file: Optional[str] = None,
+        org_cache_ttl: float = DEFAULT_ORG_CACHE_TTL,
+        org_cache_miss_ttl: float = DEFAULT_ORG_CACHE_MISS_TTL,
+        last_seen_file: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_pages: int = DEFAULT_MAX_PAGES,
+    ):
         """
         Initialize the LinkedIn monitor.
 
         Args:
             access_token: OAuth 2.0 Access Token with required permissions
+            http: HTTP client to use (defaults to the shared client)
+            org_cache_file: Optional path to cache vanity name lookups in;
+                the file may be shared by several processes
+            org_cache_ttl: Seconds a resolved organization ID is reused
+            org_cache_miss_ttl: Seconds a vanity name with no organization
+                is remembered as unknown
+            last_seen_file: Optional path to persist the newest post seen per
+                company, so later fetches page back only as far as that post
+            max_concurrency: Companies fetched at once (1 fetches serially)
+            max_pages: Pages followed per company when catching up
         """
         self.access_token = access_token
+        self.http = http or get_client()
+        self.org_cache = (
+            ExpiringCache(org_cache_file, org_cache_ttl, shared=True) if org_cache_file else None
+        )
+        self.org_cache_miss_ttl = org_cache_miss_ttl
+        self.last_seen = StateFile(last_seen_file) if last_seen_file else None
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_pages = max(1, max_pages)
         self.headers = {
             "Authorization": f"Bearer {access_token}",
             "Content-Type": "application/json",
@@ -36,13 +97,16 @@ class LinkedInMonitor:
     def _make_request(self, endpoint: str, params: Dict = None) -> Optional[Dict]:
         """Make a request to the LinkedIn API."""
         try:
-            response = requests.get(
+            response = self.http.get(
                 f"{self.API_URL}/{endpoint}",
                 headers=self.headers,
                 params=params or {}
             )
             response.raise_for_status()
             return response.json()
+        except RateLimited as e:
+            print(f"⏸️  LinkedIn rate limit reached, deferring to the next cycle ({e})")
+            return None
         except requests.exceptions.HTTPError as e:
             print(f"❌ LinkedIn API error: {e.response.status_code} - {e.response.text}")
             return None
@@ -63,16 +127,97 @@ class LinkedInMonitor:
         if not self.is_configured():
             return None
 
+        cache_key = vanity_name.lower()
+        if self.org_cache is not None:
+            # An empty string records a name with no organization
+            cached = self.org_cache.get(cache_key)
+            if cached is not None:
+                return cached or None
+
         data = self._make_request(
             "organizations",
             {"q": "vanityName", "vanityName": vanity_name}
         )
+        if data is None:
+            # Request failed; try again next time
+            return None
+
+        org_id = None
+        if data.get("elements"):
+            org_id = data["elements"][0].get("id")
 
-        if data and "elements" in data and data["elements"]:
-            org = data["elements"][0]
-            return org.get("id")
+        if self.org_cache is not None:
+            if org_id:
+                self.org_cache.set(cache_key, str(org_id))
+            else:
+                self.org_cache.set(cache_key, "", ttl=self.org_cache_miss_ttl)
+            self.org_cache.save()
 
-        return None
+        return str(org_id) if org_id else None
+
+    def iter_company_shares(self, organization_id: str, page_size: int = 25) -> Iterator[Dict]:
+        """
+        Yield a company's shares, newest first, paging with 'start'.
+
+        Without a saved last-seen post only the first page is fetched.
+        Otherwise pages are followed until that post (or an older one) is
+        reached, a short page ends the results, or max_pages pages were
+        fetched. Once iteration ends without errors the newest share is
+        staged as the company's last-seen post (see commit_state()), unless
+        max_pages ended it before the old one was reached.
+
+        Args:
+            organization_id: The LinkedIn Organization ID
+            page_size: Shares requested per page
+
+        Yields:
+            Raw shares API elements
+        """
+        last_seen = self.last_seen.get(organization_id) if self.last_seen is not None else None
+        max_pages = self.max_pages if last_seen else 1
+
+        newest = None
+        start = 0
+        complete = False
+        for _ in range(max_pages):
+            # Note: This requires Marketing Developer Platform access
+            data = self._make_request(
+                "shares",
+                {
+                    "q": "owners",
+                    "owners": f"urn:li:organization:{organization_id}",
+                    "count": page_size,
+                    "start": start,
+                }
+            )
+            if data is None:
+                # Keep the last-seen post so the next fetch covers this again
+                return
+
+            elements = data.get("elements", [])
+            reached_seen = False
+            for share in elements:
+                created = share.get("created", {}).get("time", 0)
+                if last_seen and (share.get("id") == last_seen["id"] or created < last_seen["created"]):
+                    reached_seen = True
+                    break
+                if newest is None:
+                    newest = {"id": share.get("id"), "created": created}
+                yield share
+
+            if reached_seen or len(elements) < page_size:
+                complete = True
+                break
+            start += len(elements)
+
+        if last_seen and not complete:
+            # Stopped at max_pages: moving on would skip the shares in between
+            print(f"⚠️  LinkedIn: organization {organization_id} has more than {max_pages} pages "
+                  "of new shares; keeping its last-seen post (raise max_pages)")
+            return
+
+        if self.last_seen is not None and newest is not None:
+            self.last_seen.stage(organization_id, newest)
 
     def get_company_posts(self, organization_id: str, limit: int = 25) -> List[Dict]:
         """
@@ -80,7 +225,7 @@ class LinkedInMonitor:
 
         Args:
             organization_id: The LinkedIn Organization ID
-            limit: Maximum number of posts to fetch
+            limit: Posts requested per page (see iter_company_shares)
 
         Returns:
             List of post dictionaries
@@ -89,35 +234,7 @@ class LinkedInMonitor:
             print("⚠️  LinkedIn API not configured - skipping")
             return []
 
-        posts = []
-
-        # Note: This requires Marketing Developer Platform access
-        data = self._make_request(
-            "shares",
-            {
-                "q": "owners",
-                "owners": f"urn:li:organization:{organization_id}",
-                "count": limit,
-            }
-        )
-
-        if data and "elements" in data:
-            for share in data["elements"]:
-                content = share.get("content", {})
-                text_content = share.get("text", {})
-
-                posts.append({
-                    "platform": "linkedin",
-                    "type": "post",
-                    "id": share.get("id", ""),
-                    "text": text_content.get("text", ""),
-                    "url": f"https://www.linkedin.com/feed/update/{share.get('activity', '')}",
-                    "published": datetime.fromtimestamp(
-                        share.get("created", {}).get("time", 0) / 1000
-                    ).isoformat() if share.get("created", {}).get("time") else "",
-                    "media_type": content.get("contentEntities", [{}])[0].get("entityType", ""),
-                    "fetched_at": datetime.now().isoformat(),
-                })
+        posts = [_normalize_share(share) for share in self.iter_company_shares(organization_id, limit)]
 
         return posts
 
@@ -165,47 +282,77 @@ class LinkedInMonitor:
 
         return posts
 
+    def commit_state(self):
+        """Persist the last-seen posts advanced by fetches; call once their posts are stored."""
+        if self.last_seen is not None:
+            self.last_seen.commit_staged()
+
+    def _fetch_company(self, company_id: str) -> Optional[List[Dict]]:
+        """Resolve a company ID if needed and fetch its posts; None if unresolved."""
+        # If it's a vanity name, try to resolve it
+        if not company_id.isdigit():
+            company_id = self.get_organization_id(company_id)
+            if not company_id:
+                return None
+        return self.get_company_posts(company_id)
+
     def fetch_all_companies(self, companies: List[Dict]) -> List[Dict]:
         """
-        Fetch posts from multiple LinkedIn company pages.
+        Fetch posts from multiple LinkedIn company pages concurrently.
 
         Args:
             companies: List of company dicts with 'name' and 'company_id' (org ID or vanity name)
 
         Returns:
-            Combined list of posts
+            Combined list of posts, in company order
         """
-        all_posts = []
-
+        valid = []
         for company in companies:
-            name = company.get("name", "Unknown")
-            company_id = company.get("company_id", "")
+            if company.get("company_id"):
+                valid.append(company)
+            else:
+                print(f"⚠️  Skipping {company.get('name', 'Unknown')}: No company ID provided")
 
-            if not company_id:
-                print(f"⚠️  Skipping {name}: No company ID provided")
-                continue
-
-            print(f"💼 Fetching LinkedIn: {name}...")
-
-            # If it's a vanity name, try to resolve it
-            if not company_id.isdigit():
-                resolved_id = self.get_organization_id(company_id)
-                if resolved_id:
-                    company_id = resolved_id
-                else:
-                    print(f"   Could not resolve company ID for {company_id}")
+        if not valid:
+            return []
+
+        results: List[List[Dict]] = [[] for _ in valid]
+
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(valid))) as executor:
+            futures = {
+                executor.submit(self._fetch_company, company["company_id"]): i
+                for i, company in enumerate(valid)
+            }
+
+            for future in as_completed(futures):
+                i = futures[future]
+                name = valid[i].get("name", "Unknown")
+                try:
+                    posts = future.result()
+                except Exception as e:
+                    print(f"❌ LinkedIn: {name} failed: {e}")
                     continue
 
-            posts = self.get_company_posts(company_id)
-            all_posts.extend(posts)
-            print(f"   Found {len(posts)} posts")
+                if posts is None:
+                    print(f"💼 LinkedIn: {name} - could not resolve company ID {valid[i]['company_id']}")
+                    continue
+                results[i] = posts
+                print(f"💼 LinkedIn: {name} - {len(posts)} posts")
 
-        return all_posts
+        return [post for posts in results for post in posts]
 
 
 def create_monitor(config: Dict) -> LinkedInMonitor:
     """Create a LinkedIn monitor from config."""
-    return LinkedInMonitor(config.get("access_token", ""))
+    return LinkedInMonitor(
+        config.get("access_token", ""),
+        org_cache_file=config.get("org_cache_file") or None,
+        org_cache_ttl=config.get("org_cache_ttl", DEFAULT_ORG_CACHE_TTL),
+        org_cache_miss_ttl=config.get("org_cache_miss_ttl", DEFAULT_ORG_CACHE_MISS_TTL),
+        last_seen_file=config.get("last_seen_file") or None,
+        max_concurrency=config.get("max_concurrency", DEFAULT_MAX_CONCURRENCY),
+        max_pages=config.get("max_pages", DEFAULT_MAX_PAGES),
+    )
 
 
 if __name__ == "__main__":
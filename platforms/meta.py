@@ -5,9 +5,90 @@ Uses the Meta Graph API to monitor pages you manage.
 Requires API credentials from https://developers.facebook.com/
 """
 
+import json
 import requests
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
+from urllib.parse import urlencode
+
+from .http_client import HttpClient, get_client
+from .rate_limit import RateLimited
+from .state import StateFile
+
+
+# Fields requested for Facebook page posts and Instagram media
+PAGE_POST_FIELDS = "id,message,created_time,permalink_url,shares,likes.summary(true),comments.summary(true),attachments"
+IG_MEDIA_FIELDS = "id,caption,media_type,media_url,permalink,timestamp,like_count,comments_count,thumbnail_url"
+
+MENTION_FIELDS = "id,message,created_time,from,permalink_url"
+
+# Most sub-requests the Graph API accepts in one batch
+MAX_BATCH_SIZE = 50
+
+# Default cap on result pages followed per page/account
+DEFAULT_MAX_PAGES = 10
+
+
+def _item_time(item: Dict) -> Optional[int]:
+    """Unix time of a post or media item, if it has a valid timestamp."""
+    value = item.get("created_time") or item.get("timestamp")
+    if not value:
+        return None
+    try:
+        return int(datetime.strptime(value, "%Y-%m-%dT%H:%M:%S%z").timestamp())
+    except ValueError:
+        return None
+
+
+def _normalize_page_post(post: Dict) -> Dict:
+    """Convert a Graph API page post into a post dictionary."""
+    attachments = post.get("attachments", {}).get("data", [{}])
+    attachment = attachments[0] if attachments else {}
+
+    return {
+        "platform": "facebook",
+        "type": "post",
+        "id": post.get("id", ""),
+        "text": post.get("message", ""),
+        "url": post.get("permalink_url", ""),
+        "published": post.get("created_time", ""),
+        "likes": post.get("likes", {}).get("summary", {}).get("total_count", 0),
+        "comments": post.get("comments", {}).get("summary", {}).get("total_count", 0),
+        "shares": post.get("shares", {}).get("count", 0),
+        "media_type": attachment.get("type", ""),
+        "media_url": attachment.get("url", ""),
+        "fetched_at": datetime.now().isoformat(),
+    }
+
+
+def _normalize_ig_media(media: Dict) -> Dict:
+    """Convert a Graph API Instagram media object into a post dictionary."""
+    return {
+        "platform": "instagram",
+        "type": media.get("media_type", "IMAGE").lower(),
+        "id": media.get("id", ""),
+        "text": media.get("caption", ""),
+        "url": media.get("permalink", ""),
+        "published": media.get("timestamp", ""),
+        "likes": media.get("like_count", 0),
+        "comments": media.get("comments_count", 0),
+        "media_url": media.get("media_url", media.get("thumbnail_url", "")),
+        "fetched_at": datetime.now().isoformat(),
+    }
+
+
+def _normalize_mention(post: Dict) -> Dict:
+    """Convert a Graph API tagged post into a mention dictionary."""
+    return {
+        "platform": "facebook",
+        "type": "mention",
+        "id": post.get("id", ""),
+        "text": post.get("message", ""),
+        "url": post.get("permalink_url", ""),
+        "author": post.get("from", {}).get("name", "Unknown"),
+        "published": post.get("created_time", ""),
+        "fetched_at": datetime.now().isoformat(),
+    }
 
 
 class MetaMonitor:
@@ -15,14 +96,34 @@ class MetaMonitor:
 
     GRAPH_URL = "https://graph.facebook.com/v18.0"
 
-    def __init__(self, access_token: str):
+    def __init__(
+        self,
+        access_token: str,
+        http: Optional[HttpClient] = None,
+        batch_size: int = MAX_BATCH_SIZE,
+        since_file: Optional[str] = None,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        backfill: bool = False,
+    ):
         """
         Initialize the Meta monitor.
 
         Args:
             access_token: Page Access Token with required permissions
+            http: HTTP client to use (defaults to the shared client)
+            batch_size: Page/account requests bundled into one batch call
+                (at most 50; 1 fetches each one separately)
+            since_file: Optional path to persist the newest item time per
+                page and account, so later fetches only ask for newer items
+            max_pages: Result pages followed per page/account
+            backfill: Ignore the saved times and follow every page of results
         """
         self.access_token = access_token
+        self.http = http or get_client()
+        self.batch_size = max(1, min(batch_size, MAX_BATCH_SIZE))
+        self.since = StateFile(since_file) if since_file else None
+        self.max_pages = max_pages
+        self.backfill = backfill
 
     def is_configured(self) -> bool:
         """Check if API credentials are configured."""
@@ -33,11 +134,17 @@ class MetaMonitor:
         if params is None:
             params = {}
         params["access_token"] = self.access_token
+        return self._get(f"{self.GRAPH_URL}/{endpoint}", params)
 
+    def _get(self, url: str, params: Optional[Dict] = None) -> Optional[Dict]:
+        """GET a Graph API URL, returning None on errors."""
         try:
-            response = requests.get(f"{self.GRAPH_URL}/{endpoint}", params=params)
+            response = self.http.get(url, params=params)
             response.raise_for_status()
             return response.json()
+        except RateLimited as e:
+            print(f"⏸️  Meta rate limit reached, deferring to the next cycle ({e})")
+            return None
         except requests.exceptions.HTTPError as e:
             print(f"❌ Meta API error: {e.response.status_code} - {e.response.text}")
             return None
@@ -45,6 +152,147 @@ class MetaMonitor:
             print(f"❌ Meta error: {e}")
             return None
 
+    def _batch_request(self, calls: List[Dict]) -> List[Optional[Dict]]:
+        """
+        Make several GET requests in Graph API batch calls.
+
+        Args:
+            calls: Dicts with 'endpoint' and 'params'
+
+        Returns:
+            Per call, its response body, or None if that call failed
+        """
+        results: List[Optional[Dict]] = []
+
+        for start in range(0, len(calls), self.batch_size):
+            chunk = calls[start:start + self.batch_size]
+            batch = [
+                {"method": "GET", "relative_url": f"{call['endpoint']}?{urlencode(call['params'])}"}
+                for call in chunk
+            ]
+
+            try:
+                response = self.http.post(
+                    self.GRAPH_URL,
+                    data={
+                        "access_token": self.access_token,
+                        "batch": json.dumps(batch),
+                        "include_headers": "false",
+                    },
+                )
+                response.raise_for_status()
+                answers = response.json()
+            except RateLimited as e:
+                print(f"⏸️  Meta rate limit reached, deferring to the next cycle ({e})")
+                answers = [{"code": 429, "body": ""}] * len(chunk)
+            except requests.exceptions.HTTPError as e:
+                print(f"❌ Meta API error: {e.response.status_code} - {e.response.text}")
+                answers = [{"code": e.response.status_code, "body": ""}] * len(chunk)
+            except Exception as e:
+                print(f"❌ Meta error: {e}")
+                answers = [{"code": None, "body": ""}] * len(chunk)
+
+            # One answer per sub-request is expected; missing ones count as failed
+            if not isinstance(answers, list):
+                print(f"❌ Meta API error: unexpected batch response: {str(answers)[:200]}")
+                answers = []
+            elif len(answers) != len(chunk):
+                print(f"❌ Meta API error: {len(answers)} answers for {len(chunk)} batched requests")
+            answers = answers[:len(chunk)] + [{"code": None, "body": ""}] * (len(chunk) - len(answers))
+
+            for call, answer in zip(chunk, answers):
+                if answer is None:
+                    # The sub-request did not finish within the batch; retry it alone
+                    results.append(self._make_request(call["endpoint"], dict(call["params"])))
+                elif not isinstance(answer, dict):
+                    results.append(None)
+                elif answer.get("code") == 200:
+                    try:
+                        results.append(json.loads(answer.get("body") or "{}"))
+                    except ValueError:
+                        results.append(None)
+                else:
+                    if answer.get("body"):
+                        print(f"❌ Meta API error: {answer.get('code')} - {call['endpoint']}: {answer['body']}")
+                    results.append(None)
+
+        return results
+
+    def _edge_params(self, endpoint: str, fields: str, limit: int) -> Dict:
+        """Request parameters for an edge, limited to items since the last fetch."""
+        params = {"fields": fields, "limit": limit}
+        since = self._saved_since(endpoint)
+        if since:
+            params["since"] = since
+        return params
+
+    def _saved_since(self, endpoint: str) -> Optional[int]:
+        if self.since is None or self.backfill:
+            return None
+        return self.since.get(endpoint)
+
+    def _iter_items(self, endpoint: str, params: Dict, first_page: Optional[Dict] = None) -> Iterator[Dict]:
+        """
+        Yield the items of an edge, newest first, following paging.next.
+
+        Iteration stops at the first item older than the saved time for the
+        edge, after max_pages pages (unless backfilling), or when there are
+        no more pages. Once it ends without errors the newest item's time is
+        staged, so the fetch after commit_state() starts there. If max_pages
+        ended it before the saved time was reached, the saved time is kept
+        instead.
+
+        Args:
+            endpoint: Edge path, e.g. '{page_id}/posts'
+            params: Parameters of the first request (see _edge_params)
+            first_page: Response of the first request, if already fetched
+
+        Yields:
+            Raw Graph API items
+        """
+        since = self._saved_since(endpoint)
+        data = first_page if first_page is not None else self._make_request(endpoint, dict(params))
+        if data is None:
+            return
+
+        newest = None
+        pages = 1
+        while True:
+            reached_since = False
+            for item in data.get("data", []):
+                item_time = _item_time(item)
+                if since and item_time is not None and item_time < since:
+                    # Some edges ignore 'since'; older items were seen before
+                    reached_since = True
+                    break
+                if item_time is not None and (newest is None or item_time > newest):
+                    newest = item_time
+                yield item
+
+            next_url = data.get("paging", {}).get("next")
+            if reached_since or not next_url or (pages >= self.max_pages and not self.backfill):
+                break
+
+            data = self._get(next_url)
+            if data is None:
+                # Keep the saved time so the next fetch covers this again
+                return
+            pages += 1
+
+        if since and not reached_since and next_url:
+            # Stopped at max_pages: moving on would skip the pages in between
+            print(f"⚠️  Meta: {endpoint} has more than {self.max_pages} pages of new posts; "
+                  "keeping its saved time (raise max_pages or use --backfill)")
+            return
+
+        if self.since is not None and newest is not None:
+            self.since.stage(endpoint, max(newest, since or 0))
+
+    def commit_state(self):
+        """Persist the times advanced by fetches; call once their posts are stored."""
+        if self.since is not None:
+            self.since.commit_staged()
+
     def get_page_posts(self, page_id: str, limit: int = 25) -> List[Dict]:
         """
         Get recent posts from a Facebook page.
@@ -60,33 +308,9 @@ class MetaMonitor:
             print("⚠️  Meta API not configured - skipping")
             return []
 
-        posts = []
-        params = {
-            "fields": "id,message,created_time,permalink_url,shares,likes.summary(true),comments.summary(true),attachments",
-            "limit": limit,
-        }
-
-        data = self._make_request(f"{page_id}/posts", params)
-
-        if data and "data" in data:
-            for post in data["data"]:
-                attachments = post.get("attachments", {}).get("data", [{}])
-                attachment = attachments[0] if attachments else {}
-
-                posts.append({
-                    "platform": "facebook",
-                    "type": "post",
-                    "id": post.get("id", ""),
-                    "text": post.get("message", ""),
-                    "url": post.get("permalink_url", ""),
-                    "published": post.get("created_time", ""),
-                    "likes": post.get("likes", {}).get("summary", {}).get("total_count", 0),
-                    "comments": post.get("comments", {}).get("summary", {}).get("total_count", 0),
-                    "shares": post.get("shares", {}).get("count", 0),
-                    "media_type": attachment.get("type", ""),
-                    "media_url": attachment.get("url", ""),
-                    "fetched_at": datetime.now().isoformat(),
-                })
+        endpoint = f"{page_id}/posts"
+        params = self._edge_params(endpoint, PAGE_POST_FIELDS, limit)
+        posts = [_normalize_page_post(post) for post in self._iter_items(endpoint, params)]
 
         return posts
 
@@ -105,28 +329,9 @@ class MetaMonitor:
             print("⚠️  Meta API not configured - skipping")
             return []
 
-        posts = []
-        params = {
-            "fields": "id,caption,media_type,media_url,permalink,timestamp,like_count,comments_count,thumbnail_url",
-            "limit": limit,
-        }
-
-        data = self._make_request(f"{ig_user_id}/media", params)
-
-        if data and "data" in data:
-            for media in data["data"]:
-                posts.append({
-                    "platform": "instagram",
-                    "type": media.get("media_type", "IMAGE").lower(),
-                    "id": media.get("id", ""),
-                    "text": media.get("caption", ""),
-                    "url": media.get("permalink", ""),
-                    "published": media.get("timestamp", ""),
-                    "likes": media.get("like_count", 0),
-                    "comments": media.get("comments_count", 0),
-                    "media_url": media.get("media_url", media.get("thumbnail_url", "")),
-                    "fetched_at": datetime.now().isoformat(),
-                })
+        endpoint = f"{ig_user_id}/media"
+        params = self._edge_params(endpoint, IG_MEDIA_FIELDS, limit)
+        posts = [_normalize_ig_media(media) for media in self._iter_items(endpoint, params)]
 
         return posts
 
@@ -145,26 +350,9 @@ class MetaMonitor:
             return []
 
         # Note: This requires elevated permissions
-        params = {
-            "fields": "id,message,created_time,from,permalink_url",
-            "limit": limit,
-        }
-
-        data = self._make_request(f"{page_id}/tagged", params)
-        mentions = []
-
-        if data and "data" in data:
-            for post in data["data"]:
-                mentions.append({
-                    "platform": "facebook",
-                    "type": "mention",
-                    "id": post.get("id", ""),
-                    "text": post.get("message", ""),
-                    "url": post.get("permalink_url", ""),
-                    "author": post.get("from", {}).get("name", "Unknown"),
-                    "published": post.get("created_time", ""),
-                    "fetched_at": datetime.now().isoformat(),
-                })
+        endpoint = f"{page_id}/tagged"
+        params = self._edge_params(endpoint, MENTION_FIELDS, limit)
+        mentions = [_normalize_mention(post) for post in self._iter_items(endpoint, params)]
 
         return mentions
 
@@ -172,12 +360,18 @@ class MetaMonitor:
         """
         Fetch posts from multiple Facebook/Instagram pages.
 
+        With batch_size above 1, the requests for all pages and accounts are
+        bundled into Graph API batch calls.
+
         Args:
             pages: List of page dicts with 'name', 'page_id', and optional 'instagram_id'
 
         Returns:
             Combined list of posts
         """
+        if self.batch_size > 1 and self.is_configured():
+            return self._fetch_pages_batched(pages)
+
         all_posts = []
 
         for page in pages:
@@ -199,10 +393,56 @@ class MetaMonitor:
 
         return all_posts
 
+    def _fetch_pages_batched(self, pages: List[Dict], limit: int = 25) -> List[Dict]:
+        """Fetch every page's posts and account's media through batch calls."""
+        calls = []
+        for page in pages:
+            name = page.get("name", "Unknown")
+            if page.get("page_id"):
+                endpoint = f"{page['page_id']}/posts"
+                calls.append({
+                    "label": f"📘 Fetching Facebook: {name}...",
+                    "kind": "Facebook",
+                    "normalize": _normalize_page_post,
+                    "endpoint": endpoint,
+                    "params": self._edge_params(endpoint, PAGE_POST_FIELDS, limit),
+                })
+            if page.get("instagram_id"):
+                endpoint = f"{page['instagram_id']}/media"
+                calls.append({
+                    "label": f"📸 Fetching Instagram: {name}...",
+                    "kind": "Instagram",
+                    "normalize": _normalize_ig_media,
+                    "endpoint": endpoint,
+                    "params": self._edge_params(endpoint, IG_MEDIA_FIELDS, limit),
+                })
+
+        all_posts = []
+        for call, data in zip(calls, self._batch_request(calls)):
+            print(call["label"])
+            if data is None:
+                print(f"   ❌ {call['kind']} request failed")
+                continue
+
+            # Further pages, if any, are followed one request at a time
+            posts = [
+                call["normalize"](item)
+                for item in self._iter_items(call["endpoint"], call["params"], first_page=data)
+            ]
+            all_posts.extend(posts)
+            print(f"   Found {len(posts)} {call['kind']} posts")
+
+        return all_posts
+
 
 def create_monitor(config: Dict) -> MetaMonitor:
     """Create a Meta monitor from config."""
-    return MetaMonitor(config.get("access_token", ""))
+    return MetaMonitor(
+        config.get("access_token", ""),
+        batch_size=config.get("batch_size", MAX_BATCH_SIZE),
+        since_file=config.get("since_file") or None,
+        max_pages=config.get("max_pages", DEFAULT_MAX_PAGES),
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,182 @@
+"""
+Rate Limiting
+==============
+Paces API calls using the rate-limit information servers send back, so
+monitors slow down before hitting a limit instead of running into 429s.
+
+Two kinds of headers are understood:
+
+- X API: x-rate-limit-limit / x-rate-limit-remaining / x-rate-limit-reset,
+  tracked per endpoint (host + path, with IDs collapsed)
+- Graph API: X-App-Usage, a percentage of the app's hourly budget,
+  tracked per host because it is shared by every endpoint
+
+While plenty of calls remain they go out immediately. Once the remaining
+calls fall below a reserve they are spread evenly until the window
+resets. A call that would have to wait longer than max_wait raises
+RateLimited so the caller can defer the work to its next cycle.
+"""
+
+import json
+import re
+import threading
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+
+# Start pacing when fewer than this fraction of a window's calls remain
+PACE_BELOW = 0.2
+
+# Graph API usage (percent) from which calls are slowed down, the spacing
+# used as usage approaches 100%, and the pause once it is exceeded
+APP_USAGE_THRESHOLD = 75.0
+APP_USAGE_MAX_INTERVAL = 10.0
+APP_USAGE_COOLDOWN = 300.0
+
+# Path segments that are object IDs rather than API names or versions
+_ID_SEGMENT_RE = re.compile(r"^(\d{4,}|[0-9a-f]{16,}|urn:.*)$", re.IGNORECASE)
+
+
+class RateLimited(requests.RequestException):
+    """A call was not made because its rate limit window is exhausted."""
+
+    def __init__(self, endpoint: str, retry_in: float):
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+        super().__init__(f"rate limit for {endpoint} resets in {retry_in:.0f}s")
+
+
+class _Bucket:
+    """Known limit state of one endpoint (or host)."""
+
+    def __init__(self):
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        # time.monotonic() at which the window resets
+        self.reset_at: Optional[float] = None
+        # Minimum spacing between calls, from usage percentages
+        self.interval = 0.0
+        self.next_at = 0.0
+
+    def delay(self, now: float) -> float:
+        """Seconds until the next call may be made."""
+        if self.reset_at is not None and now >= self.reset_at:
+            # Window over; the next response reports the new one
+            self.limit = self.remaining = self.reset_at = None
+            self.interval = 0.0
+
+        if self.remaining is not None and self.remaining <= 0 and self.reset_at is not None:
+            return self.reset_at - now
+        return max(0.0, self.next_at - now)
+
+    def reserve(self, now: float, start: float):
+        """Account for a call made at start."""
+        interval = self.interval
+        if self.remaining is not None:
+            if self.reset_at is not None and self.limit and self.remaining < self.limit * PACE_BELOW:
+                interval = max(interval, (self.reset_at - start) / max(1, self.remaining))
+            self.remaining -= 1
+        self.next_at = start + interval
+
+
+class RateLimiter:
+    """Per-endpoint pacing fed by rate-limit response headers."""
+
+    def __init__(self, max_wait: float = 30.0):
+        """
+        Initialize the limiter.
+
+        Args:
+            max_wait: Longest a call may be delayed; calls that would wait
+                longer raise RateLimited
+        """
+        self.max_wait = max_wait
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def endpoint(url: str) -> str:
+        """Bucket key for a URL: host and path, with ID segments collapsed."""
+        parts = urlsplit(url)
+        segments = [
+            ":id" if _ID_SEGMENT_RE.match(segment) else segment
+            for segment in parts.path.split("/")
+        ]
+        return parts.netloc + "/".join(segments)
+
+    def _keys(self, url: str) -> List[str]:
+        return [urlsplit(url).netloc, self.endpoint(url)]
+
+    def acquire(self, url: str):
+        """
+        Wait until a call to the URL may be made, and reserve it.
+
+        Raises:
+            RateLimited: If the wait would exceed max_wait
+        """
+        with self._lock:
+            now = time.monotonic()
+            buckets = [self._buckets[key] for key in self._keys(url) if key in self._buckets]
+            wait = max([bucket.delay(now) for bucket in buckets], default=0.0)
+            if wait > self.max_wait:
+                raise RateLimited(self.endpoint(url), wait)
+            for bucket in buckets:
+                bucket.reserve(now, now + wait)
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def update(self, url: str, response: requests.Response) -> bool:
+        """
+        Record the limit state reported by a response.
+
+        Returns:
+            Whether the endpoint is now blocked until a known time
+        """
+        headers = response.headers
+        now = time.monotonic()
+        blocked = False
+
+        with self._lock:
+            remaining = headers.get("x-rate-limit-remaining")
+            reset = headers.get("x-rate-limit-reset")
+            if remaining is not None and reset is not None:
+                bucket = self._buckets.setdefault(self.endpoint(url), _Bucket())
+                try:
+                    bucket.remaining = int(remaining)
+                    bucket.limit = int(headers.get("x-rate-limit-limit", 0)) or None
+                    # Reset is an epoch timestamp
+                    bucket.reset_at = now + max(0.0, float(reset) - time.time())
+                except ValueError:
+                    pass
+                else:
+                    blocked = bucket.remaining <= 0
+
+            app_usage = headers.get("x-app-usage")
+            if app_usage:
+                bucket = self._buckets.setdefault(urlsplit(url).netloc, _Bucket())
+                try:
+                    usage = max(float(value) for value in json.loads(app_usage).values())
+                except (ValueError, TypeError, AttributeError):
+                    usage = 0.0
+                if usage >= 100:
+                    bucket.remaining, bucket.reset_at = 0, now + APP_USAGE_COOLDOWN
+                    blocked = True
+                elif usage >= APP_USAGE_THRESHOLD:
+                    bucket.interval = APP_USAGE_MAX_INTERVAL * (
+                        (usage - APP_USAGE_THRESHOLD) / (100 - APP_USAGE_THRESHOLD)
+                    )
+                    bucket.next_at = max(bucket.next_at, now + bucket.interval)
+                else:
+                    bucket.interval = 0.0
+
+            retry_after = headers.get("Retry-After", "")
+            if response.status_code == 429 and not blocked and retry_after.isdigit():
+                bucket = self._buckets.setdefault(self.endpoint(url), _Bucket())
+                bucket.remaining, bucket.reset_at = 0, now + float(retry_after)
+                blocked = True
+
+        return blocked
@@ -0,0 +1,176 @@
+"""
+Persistent State
+=================
+Small JSON files for state that monitors keep between runs, such as
+feed validators, search cursors and lookup caches.
+
+Positions such as search cursors can be staged: a staged value is held
+back, and get() keeps returning the previous one, until commit_staged()
+is called once the fetched posts are safely stored.
+
+A file opened with shared=True may also be written by other processes
+(e.g. the CLI and the backend): it is re-read when its modification
+time changes, and saving merges this process's changes into the
+current contents instead of overwriting them.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional, Set, Tuple
+
+
+class StateFile:
+    """Thread-safe JSON key/value file, loaded on first use."""
+
+    def __init__(self, path: str, shared: bool = False):
+        """
+        Initialize the state file.
+
+        Args:
+            path: Path to the JSON file (created on first save)
+            shared: Pick up and merge with writes by other processes
+        """
+        self.path = path
+        self.shared = shared
+        self._data: Dict[str, Any] = {}
+        self._loaded = False
+        # Keys set or deleted since the last save
+        self._changed: Set[str] = set()
+        self._mtime: Optional[int] = None
+        # Values held back until commit_staged()
+        self._staged: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+
+    def _file_mtime(self) -> Optional[int]:
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _ensure_loaded(self):
+        if self._loaded and not (self.shared and self._file_mtime() != self._mtime):
+            return
+
+        self._mtime = self._file_mtime()
+        data: Dict[str, Any] = {}
+        if self._mtime is not None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except (json.JSONDecodeError, IOError) as e:
+                print(f"⚠️  Ignoring unreadable state file {self.path}: {e}")
+                data = {}
+
+        # Unsaved changes take precedence over the file
+        for key in self._changed:
+            if key in self._data:
+                data[key] = self._data[key]
+            else:
+                data.pop(key, None)
+
+        self._data = data
+        self._loaded = True
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a value."""
+        with self._lock:
+            self._ensure_loaded()
+            return self._data.get(key, default)
+
+    def set(self, key: str, value: Any):
+        """Set a value (written on the next save)."""
+        with self._lock:
+            self._ensure_loaded()
+            self._data[key] = value
+            self._changed.add(key)
+
+    def delete(self, key: str):
+        """Remove a value if present."""
+        with self._lock:
+            self._ensure_loaded()
+            if key in self._data:
+                del self._data[key]
+                self._changed.add(key)
+
+    def stage(self, key: str, value: Any):
+        """Set a value once commit_staged() is called; until then get() returns the old one."""
+        with self._lock:
+            self._staged[key] = value
+
+    def commit_staged(self):
+        """Apply the staged values and save the file."""
+        with self._lock:
+            staged, self._staged = self._staged, {}
+            for key, value in staged.items():
+                self.set(key, value)
+            self.save()
+
+    def discard_staged(self):
+        """Drop the staged values."""
+        with self._lock:
+            self._staged = {}
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """Iterate over a copy of the stored items."""
+        with self._lock:
+            self._ensure_loaded()
+            return iter(list(self._data.items()))
+
+    def save(self):
+        """Write the file if anything changed, replacing it atomically."""
+        with self._lock:
+            if not self._changed:
+                return
+            if self.shared:
+                # Merge with whatever other processes saved meanwhile
+                self._ensure_loaded()
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self._mtime = self._file_mtime()
+            self._changed = set()
+
+
+class ExpiringCache:
+    """Size-bounded LRU cache whose entries expire, kept in a StateFile."""
+
+    def __init__(self, path: str, ttl: float, max_entries: int = 1000, shared: bool = False):
+        """
+        Initialize the cache.
+
+        Args:
+            path: Path to the JSON file (created on first save)
+            ttl: Default seconds an entry stays valid
+            max_entries: Entries kept; the least recently used go first
+            shared: Pick up and merge with writes by other processes
+        """
+        self.state = StateFile(path, shared=shared)
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a value that has not expired."""
+        entry = self.state.get(key)
+        now = time.time()
+        if not entry or entry["expires"] <= now:
+            return default
+        self.state.set(key, dict(entry, used=now))
+        return entry["value"]
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """Store a value (written on the next save)."""
+        now = time.time()
+        expires = now + (self.ttl if ttl is None else ttl)
+        self.state.set(key, {"value": value, "expires": expires, "used": now})
+
+    def save(self):
+        """Drop expired and excess entries, then write the file if changed."""
+        now = time.time()
+        entries = sorted(self.state.items(), key=lambda item: item[1]["used"], reverse=True)
+        for position, (key, entry) in enumerate(entries):
+            if position >= self.max_entries or entry["expires"] <= now:
+                self.state.delete(key)
+        self.state.save()
@@ -7,23 +7,110 @@ Requires API credentials from https://developer.twitter.com/
 
 import requests
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional
 import re
 
+from .http_client import HttpClient, get_client
+from .rate_limit import RateLimited
+from .state import StateFile
+
+
+# Longest query the search endpoint accepts on the standard access tiers
+MAX_QUERY_LENGTH = 512
+
+# Default cap on pages requested per search
+DEFAULT_MAX_PAGES = 10
+
+
+def _query_term(term: str) -> str:
+    """
+    Format a keyword or from: clause as a search query term.
+
+    A multi-word keyword is grouped so it matches tweets containing all
+    of its words, as it would on its own; quote it for an exact phrase.
+    """
+    if re.search(r"\s", term) and not term.startswith('"'):
+        return "(" + " ".join(term.split()) + ")"
+    return term
+
+
+def build_query(terms: List[str]) -> str:
+    """Combine terms into one query matching any of them."""
+    return " OR ".join(_query_term(term) for term in terms)
+
+
+def pack_queries(terms: List[str], max_length: int = MAX_QUERY_LENGTH) -> List[List[str]]:
+    """
+    Group terms so each group fits in a single OR'ed query.
+
+    Args:
+        terms: Keywords or from: clauses, in order
+        max_length: Maximum query length in characters
+
+    Returns:
+        Groups of terms, in order; build_query() turns each into a query
+    """
+    groups: List[List[str]] = []
+    current: List[str] = []
+
+    for term in terms:
+        if current and len(build_query(current + [term])) > max_length:
+            groups.append(current)
+            current = []
+        current.append(term)
+
+    if current:
+        groups.append(current)
+    return groups
+
+
+def _word_pattern(words: str) -> str:
+    """Regex source matching words as whole words."""
+    return r"(?<!\w)" + re.escape(words) + r"(?!\w)"
+
+
+def _keyword_pattern(keyword: str) -> re.Pattern:
+    """
+    Case-insensitive pattern matching a keyword the way the search does:
+    a quoted keyword as an exact phrase, otherwise each of its words
+    anywhere in the text.
+    """
+    if keyword.startswith('"'):
+        return re.compile(_word_pattern(keyword.strip('"')), re.IGNORECASE)
+    lookaheads = "".join(f"(?=.*{_word_pattern(word)})" for word in keyword.split())
+    return re.compile("^" + lookaheads, re.IGNORECASE | re.DOTALL)
+
 
 class TwitterMonitor:
     """Monitor X/Twitter for posts and mentions."""
 
     BASE_URL = "https://api.twitter.com/2"
 
-    def __init__(self, bearer_token: str):
+    def __init__(
+        self,
+        bearer_token: str,
+        http: Optional[HttpClient] = None,
+        cursor_file: Optional[str] = None,
+        max_query_length: int = MAX_QUERY_LENGTH,
+        max_pages: int = DEFAULT_MAX_PAGES,
+    ):
         """
         Initialize the Twitter monitor.
 
         Args:
             bearer_token: X API Bearer Token
+            http: HTTP client to use (defaults to the shared client)
+            cursor_file: Optional path to persist the newest tweet ID seen per
+                query, so later searches only ask for newer tweets
+            max_query_length: Query length limit of the API access tier, used
+                when packing keywords and accounts into combined queries
+            max_pages: Most result pages requested for a single search
         """
         self.bearer_token = bearer_token
+        self.http = http or get_client()
+        self.cursors = StateFile(cursor_file) if cursor_file else None
+        self.max_query_length = max_query_length
+        self.max_pages = max_pages
         self.headers = {
             "Authorization": f"Bearer {bearer_token}",
             "Content-Type": "application/json",
@@ -33,78 +120,169 @@ class TwitterMonitor:
         """Check if API credentials are configured."""
         return bool(self.bearer_token)
 
+    def get_cursor(self, query: str) -> Optional[str]:
+        """Get the newest tweet ID seen for a query, if cursors are enabled."""
+        return self.cursors.get(query) if self.cursors else None
+
+    def commit_state(self):
+        """Persist the cursors advanced by searches; call once their tweets are stored."""
+        if self.cursors:
+            self.cursors.commit_staged()
+
     def search_recent(
         self, query: str, max_results: int = 100, since_hours: int = 24
     ) -> List[Dict]:
         """
         Search for recent tweets matching a query.
 
+        Collects iter_search(); see there for paging and cursors.
+
         Args:
             query: Search query (supports X search operators)
-            max_results: Maximum number of results (10-100)
+            max_results: Maximum number of results
             since_hours: How far back to search (max 7 days for basic API)
 
         Returns:
             List of tweet dictionaries
         """
+        return list(self.iter_search(query, max_results, since_hours))
+
+    def iter_search(
+        self, query: str, max_results: int = 100, since_hours: int = 24
+    ) -> Iterator[Dict]:
+        """
+        Yield recent tweets matching a query, newest first, page by page.
+
+        Pages are requested by following meta.next_token until max_results
+        tweets were yielded, a tweet older than since_hours is reached, there
+        are no more pages, or max_pages were requested. Only one page is
+        held at a time.
+
+        With cursors enabled, only tweets newer than the newest one seen by
+        the previous complete search for the same query are requested; the
+        since_hours window is used when there is no cursor yet. The cursor
+        advances only when the generator runs to the end without errors and,
+        if a cursor was used, without stopping at max_results or max_pages
+        before reaching it. Advanced cursors take effect (and are saved)
+        on commit_state().
+
+        Args:
+            query: Search query (supports X search operators)
+            max_results: Maximum number of tweets to yield
+            since_hours: How far back to search (max 7 days for basic API)
+
+        Yields:
+            Tweet dictionaries
+        """
         if not self.is_configured():
             print("⚠️  Twitter API not configured - skipping")
-            return []
+            return
 
-        tweets = []
         endpoint = f"{self.BASE_URL}/tweets/search/recent"
-
-        # Calculate start time
-        start_time = (datetime.utcnow() - timedelta(hours=since_hours)).isoformat() + "Z"
+        horizon = (datetime.utcnow() - timedelta(hours=since_hours)).isoformat() + "Z"
 
         params = {
             "query": query,
-            "max_results": min(max_results, 100),
-            "start_time": start_time,
             "tweet.fields": "created_at,public_metrics,author_id,conversation_id",
             "expansions": "author_id",
             "user.fields": "name,username,profile_image_url",
         }
 
-        try:
-            response = requests.get(endpoint, headers=self.headers, params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            # Build user lookup
-            users = {}
-            if "includes" in data and "users" in data["includes"]:
-                for user in data["includes"]["users"]:
-                    users[user["id"]] = user
-
-            # Process tweets
-            for tweet in data.get("data", []):
-                author = users.get(tweet["author_id"], {})
-                metrics = tweet.get("public_metrics", {})
-
-                tweets.append({
-                    "platform": "twitter",
-                    "type": "tweet",
-                    "id": tweet["id"],
-                    "text": tweet["text"],
-                    "url": f"https://twitter.com/{author.get('username', 'i')}/status/{tweet['id']}",
-                    "author": author.get("name", "Unknown"),
-                    "author_username": author.get("username", ""),
-                    "author_avatar": author.get("profile_image_url", ""),
-                    "published": tweet.get("created_at", ""),
-                    "likes": metrics.get("like_count", 0),
-                    "retweets": metrics.get("retweet_count", 0),
-                    "replies": metrics.get("reply_count", 0),
-                    "query": query,
-                    "fetched_at": datetime.now().isoformat(),
-                })
+        since_id = self.get_cursor(query)
+        if since_id:
+            params["since_id"] = since_id
+        else:
+            params["start_time"] = horizon
 
+        newest_id = None
+        remaining = max_results
+        # Stopped by max_results or max_pages while more tweets were left
+        truncated = False
+
+        try:
+            for page in range(self.max_pages):
+                # The endpoint accepts 10-100 results per page
+                params["max_results"] = min(100, max(10, remaining))
+                response = self.http.get(endpoint, headers=self.headers, params=params)
+
+                if since_id and page == 0 and response.status_code == 400:
+                    # The cursor fell out of the searchable window; start over
+                    print(f"   Cursor for '{query}' expired - searching the last {since_hours}h")
+                    self.cursors.delete(query)
+                    yield from self.iter_search(query, max_results, since_hours)
+                    return
+
+                response.raise_for_status()
+                data = response.json()
+                meta = data.get("meta", {})
+                if page == 0:
+                    newest_id = meta.get("newest_id")
+
+                # Build user lookup
+                users = {}
+                if "includes" in data and "users" in data["includes"]:
+                    for user in data["includes"]["users"]:
+                        users[user["id"]] = user
+
+                for tweet in data.get("data", []):
+                    if tweet.get("created_at", horizon) < horizon:
+                        break
+                    if remaining <= 0:
+                        truncated = True
+                        break
+                    yield self._parse_tweet(tweet, users, query)
+                    remaining -= 1
+                else:
+                    if meta.get("next_token"):
+                        if remaining > 0:
+                            params["next_token"] = meta["next_token"]
+                            continue
+                        truncated = True
+                break
+            else:
+                truncated = True
+
+        except RateLimited as e:
+            # The cursor is not advanced, so the next cycle picks this up
+            print(f"⏸️  Twitter rate limit reached, deferring '{query}' to the next cycle ({e})")
+            return
         except requests.exceptions.HTTPError as e:
             print(f"❌ Twitter API error: {e.response.status_code} - {e.response.text}")
+            return
         except Exception as e:
             print(f"❌ Twitter error: {e}")
-
-        return tweets
+            return
+
+        if since_id and truncated:
+            # Advancing would skip the tweets between here and the cursor
+            print(f"⚠️  Search for '{query}' stopped before reaching its cursor; keeping the cursor "
+                  "(raise max_results or max_pages)")
+            return
+
+        if self.cursors and newest_id:
+            self.cursors.stage(query, newest_id)
+
+    def _parse_tweet(self, tweet: Dict, users: Dict[str, Dict], query: str) -> Dict:
+        """Convert an API tweet into a post dictionary."""
+        author = users.get(tweet["author_id"], {})
+        metrics = tweet.get("public_metrics", {})
+
+        return {
+            "platform": "twitter",
+            "type": "tweet",
+            "id": tweet["id"],
+            "text": tweet["text"],
+            "url": f"https://twitter.com/{author.get('username', 'i')}/status/{tweet['id']}",
+            "author": author.get("name", "Unknown"),
+            "author_username": author.get("username", ""),
+            "author_avatar": author.get("profile_image_url", ""),
+            "published": tweet.get("created_at", ""),
+            "likes": metrics.get("like_count", 0),
+            "retweets": metrics.get("retweet_count", 0),
+            "replies": metrics.get("reply_count", 0),
+            "query": query,
+            "fetched_at": datetime.now().isoformat(),
+        }
 
     def get_user_tweets(self, username: str, max_results: int = 10) -> List[Dict]:
         """
@@ -122,58 +300,92 @@ class TwitterMonitor:
         query = f"from:{username}"
         return self.search_recent(query, max_results)
 
-    def search_keywords(self, keywords: List[str], max_per_keyword: int = 50) -> List[Dict]:
+    def search_keywords(self, keywords: List[str], max_per_keyword: int = 50) -> Iterator[Dict]:
         """
         Search for tweets containing any of the specified keywords.
 
+        Keywords are packed into as few OR'ed queries as the query length
+        limit allows, and each tweet is attributed back to the keywords
+        found in its text ('matched_keyword' is the first of
+        'matched_keywords'). Tweets the API matched on something other than
+        their text (e.g. an expanded link) are kept without attribution.
+
+        Tweets are yielded page by page as the searches run. A tweet found
+        again by a later query is not yielded twice; its keywords are added
+        to the tweet already yielded.
+
         Args:
             keywords: List of keywords to search
             max_per_keyword: Max results per keyword
 
-        Returns:
-            Combined list of matching tweets
+        Yields:
+            Matching tweets, each once
         """
-        all_tweets = []
-        seen_ids = set()
-
-        for keyword in keywords:
-            print(f"🐦 Searching Twitter for: {keyword}...")
-            tweets = self.search_recent(keyword, max_per_keyword)
-
-            for tweet in tweets:
-                if tweet["id"] not in seen_ids:
-                    tweet["matched_keyword"] = keyword
-                    all_tweets.append(tweet)
-                    seen_ids.add(tweet["id"])
-
-            print(f"   Found {len(tweets)} tweets")
-
-        return all_tweets
-
-    def fetch_accounts(self, accounts: List[str]) -> List[Dict]:
+        seen: Dict[str, Dict] = {}
+
+        for group in pack_queries(keywords, self.max_query_length):
+            print(f"🐦 Searching Twitter for: {', '.join(group)}...")
+            patterns = [(keyword, _keyword_pattern(keyword)) for keyword in group]
+            found = 0
+
+            for tweet in self.iter_search(build_query(group), max_per_keyword * len(group)):
+                found += 1
+                matched = [keyword for keyword, pattern in patterns if pattern.search(tweet["text"])]
+
+                existing = seen.get(tweet["id"])
+                if existing is not None:
+                    # Found again by another query; only add its keywords
+                    if matched:
+                        existing.setdefault("matched_keyword", matched[0])
+                        existing["matched_keywords"] = existing.get("matched_keywords", []) + matched
+                    continue
+
+                if matched:
+                    tweet["matched_keyword"] = matched[0]
+                    tweet["matched_keywords"] = matched
+                seen[tweet["id"]] = tweet
+                yield tweet
+
+            print(f"   Found {found} tweets")
+
+    def fetch_accounts(self, accounts: List[str], max_per_account: int = 10) -> Iterator[Dict]:
         """
         Fetch recent tweets from multiple accounts.
 
+        Accounts are packed into combined from: queries, and each tweet is
+        tagged with the monitored account it came from ('matched_account').
+
         Args:
             accounts: List of usernames to monitor
+            max_per_account: Max results per account
 
-        Returns:
-            Combined list of tweets
+        Yields:
+            Tweets, page by page as the searches run
         """
-        all_tweets = []
+        usernames = {account.lstrip("@").lower(): account for account in accounts}
+        clauses = [f"from:{account.lstrip('@')}" for account in accounts]
 
-        for account in accounts:
-            print(f"🐦 Fetching Twitter: {account}...")
-            tweets = self.get_user_tweets(account)
-            all_tweets.extend(tweets)
-            print(f"   Found {len(tweets)} tweets")
+        for group in pack_queries(clauses, self.max_query_length):
+            print(f"🐦 Fetching Twitter: {', '.join(clause[5:] for clause in group)}...")
+            found = 0
 
-        return all_tweets
+            for tweet in self.iter_search(build_query(group), max_per_account * len(group)):
+                account = usernames.get(tweet["author_username"].lower())
+                if account:
+                    tweet["matched_account"] = account
+                found += 1
+                yield tweet
+            print(f"   Found {found} tweets")
 
 
-def create_monitor(config: Dict) -> TwitterMonitor:
+def create_monitor(config: Dict, cursor_file: Optional[str] = None) -> TwitterMonitor:
     """Create a Twitter monitor from config."""
-    return TwitterMonitor(config.get("bearer_token", ""))
+    return TwitterMonitor(
+        config.get("bearer_token", ""),
+        cursor_file=cursor_file,
+        max_query_length=config.get("max_query_length", MAX_QUERY_LENGTH),
+        max_pages=config.get("max_pages", DEFAULT_MAX_PAGES),
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,110 @@
+"""
+Usage Ledger
+=============
+Persistent record of what paid API calls cost and what they returned,
+per search target, so spend can be reported and capped.
+
+Each call adds its input/output tokens, latency and post count to the
+totals of its target (e.g. 'keyword:prop firm') and its tokens to the
+day's total. The most recent calls are also kept individually.
+"""
+
+import threading
+from datetime import date
+from typing import Dict, List, Optional
+
+from .state import StateFile
+
+
+# Individual calls kept in the ledger
+RECENT_CALLS = 500
+
+
+class UsageLedger:
+    """Token, latency and yield totals per target, kept in a StateFile."""
+
+    def __init__(self, path: str):
+        """
+        Initialize the ledger.
+
+        Args:
+            path: Path to the JSON file (created on first save)
+        """
+        self.state = StateFile(path)
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        target: str,
+        prompt_tokens: int,
+        completion_tokens: int,
+        latency: float,
+        posts: int,
+    ):
+        """Add one call's usage (written on the next save)."""
+        with self._lock:
+            self._record(target, prompt_tokens, completion_tokens, latency, posts)
+
+    def _record(self, target: str, prompt_tokens: int, completion_tokens: int, latency: float, posts: int):
+        targets = self.state.get("targets", {})
+        totals = targets.get(target, {
+            "calls": 0, "prompt_tokens": 0, "completion_tokens": 0, "latency": 0.0, "posts": 0,
+        })
+        totals = {
+            "calls": totals["calls"] + 1,
+            "prompt_tokens": totals["prompt_tokens"] + prompt_tokens,
+            "completion_tokens": totals["completion_tokens"] + completion_tokens,
+            "latency": round(totals["latency"] + latency, 3),
+            "posts": totals["posts"] + posts,
+        }
+        self.state.set("targets", dict(targets, **{target: totals}))
+
+        today = date.today().isoformat()
+        daily = self.state.get("daily", {})
+        self.state.set("daily", dict(daily, **{today: daily.get(today, 0) + prompt_tokens + completion_tokens}))
+
+        recent = self.state.get("recent", [])[-(RECENT_CALLS - 1):]
+        recent.append({
+            "target": target,
+            "day": today,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "latency": round(latency, 3),
+            "posts": posts,
+        })
+        self.state.set("recent", recent)
+
+    def totals(self, target: str) -> Optional[Dict]:
+        """Totals recorded for a target, if any."""
+        return self.state.get("targets", {}).get(target)
+
+    def tokens_per_call(self, target: str) -> Optional[float]:
+        """Average tokens a call for the target used."""
+        totals = self.totals(target)
+        if not totals or not totals["calls"]:
+            return None
+        return (totals["prompt_tokens"] + totals["completion_tokens"]) / totals["calls"]
+
+    def efficiency(self, target: str) -> Optional[float]:
+        """Posts returned per 1,000 tokens spent on the target."""
+        totals = self.totals(target)
+        if not totals:
+            return None
+        tokens = totals["prompt_tokens"] + totals["completion_tokens"]
+        return 1000 * totals["posts"] / tokens if tokens else None
+
+    def daily_tokens(self, day: Optional[str] = None) -> int:
+        """Tokens spent on a day (default today)."""
+        return self.state.get("daily", {}).get(day or date.today().isoformat(), 0)
+
+    def report(self) -> List[Dict]:
+        """Totals and efficiency per target, most efficient first."""
+        rows = []
+        for target, totals in self.state.get("targets", {}).items():
+            efficiency = self.efficiency(target)
+            rows.append(dict(totals, target=target, posts_per_1k_tokens=efficiency))
+        return sorted(rows, key=lambda row: row["posts_per_1k_tokens"] or 0, reverse=True)
+
+    def save(self):
+        """Write the ledger if anything changed."""
+        self.state.save()
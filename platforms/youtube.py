@@ -2,13 +2,38 @@
 YouTube Monitor
 ================
 Uses RSS feeds to monitor YouTube channels without requiring API keys.
+
+Feeds are parsed in one streaming pass with xml.etree, reading only the
+fields of YouTube's Atom schema that end up in the video dicts.
+feedparser is used instead for anything that is not a well-formed Atom
+feed.
 """
 
 import feedparser
+import hashlib
+import io
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import List, Dict, Optional
 import re
 
+from .http_client import get_client
+from .state import StateFile
+
+
+# Default number of feeds fetched at once
+DEFAULT_MAX_WORKERS = 8
+
+# Default per-feed timeout in seconds (connect and read)
+DEFAULT_FEED_TIMEOUT = 15
+
+# XML namespaces used by YouTube feeds
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_YT = "{http://www.youtube.com/xml/schemas/2015}"
+_MEDIA = "{http://search.yahoo.com/mrss/}"
+
 
 def get_channel_feed_url(channel_id: str) -> str:
     """Convert a channel ID to its RSS feed URL."""
@@ -20,13 +45,231 @@ def get_user_feed_url(username: str) -> str:
     return f"https://www.youtube.com/feeds/videos.xml?user={username}"
 
 
-def parse_feed(feed_url: str, channel_name: str = "Unknown") -> List[Dict]:
+def download_feed(feed_url: str, timeout: float = DEFAULT_FEED_TIMEOUT) -> bytes:
+    """
+    Download a feed's raw XML.
+
+    Args:
+        feed_url: The RSS feed URL
+        timeout: Connect and read timeout in seconds; the download is not
+            retried, so this bounds how long a slow feed can take
+
+    Returns:
+        The response body
+
+    Raises:
+        requests.RequestException: On network errors or non-2xx responses
+    """
+    response = get_client().get(feed_url, timeout=timeout, retries=0)
+    response.raise_for_status()
+    return response.content
+
+
+def fetch_feed_cached(
+    feed_url: str,
+    channel_name: str,
+    cache: StateFile,
+    timeout: float = DEFAULT_FEED_TIMEOUT,
+) -> Dict:
+    """
+    Fetch and parse a feed using a persistent validator cache.
+
+    Sends If-None-Match / If-Modified-Since from the previous response and
+    reuses the previously parsed videos on 304, or when the body is
+    byte-for-byte unchanged.
+
+    Args:
+        feed_url: The RSS feed URL
+        channel_name: Display name for the channel
+        cache: State file holding one entry per feed URL
+        timeout: Connect and read timeout in seconds; the request is not
+            retried (see download_feed())
+
+    Returns:
+        Dict with 'videos' and 'cache' ('not_modified', 'unchanged' or None)
+
+    Raises:
+        requests.RequestException: On network errors or non-2xx responses
+    """
+    entry = cache.get(feed_url) or {}
+
+    headers = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+
+    response = get_client().get(feed_url, headers=headers, timeout=timeout, retries=0)
+
+    if response.status_code == 304 and "videos" in entry:
+        return {"videos": [dict(video) for video in entry["videos"]], "cache": "not_modified"}
+
+    response.raise_for_status()
+    body_hash = hashlib.blake2b(response.content, digest_size=16).hexdigest()
+
+    if body_hash == entry.get("body_hash") and "videos" in entry:
+        videos, status = entry["videos"], "unchanged"
+    else:
+        videos, status = parse_entries(response.content, channel_name), None
+
+    cache.set(feed_url, {
+        "etag": response.headers.get("ETag", ""),
+        "last_modified": response.headers.get("Last-Modified", ""),
+        "body_hash": body_hash,
+        "videos": videos,
+    })
+
+    return {"videos": [dict(video) for video in videos], "cache": status}
+
+
+def parse_entries(content: bytes, channel_name: str = "Unknown") -> List[Dict]:
+    """
+    Parse downloaded YouTube feed XML into video entries.
+
+    Uses parse_atom_entries, falling back to feedparser for input that is
+    not a well-formed Atom feed.
+
+    Args:
+        content: The feed XML
+        channel_name: Display name for the channel
+
+    Returns:
+        List of video dictionaries
+    """
+    try:
+        return parse_atom_entries(content, channel_name)
+    except (ET.ParseError, ValueError):
+        return parse_entries_feedparser(content, channel_name)
+
+
+def parse_atom_entries(content: bytes, channel_name: str = "Unknown") -> List[Dict]:
+    """
+    Parse a YouTube Atom feed in a single streaming pass.
+
+    Each entry is turned into a video dict as soon as it has been read and
+    then discarded, so the feed is never held as a full tree.
+
+    Args:
+        content: The feed XML
+        channel_name: Display name for the channel
+
+    Returns:
+        List of video dictionaries, as parse_entries_feedparser returns them
+
+    Raises:
+        ET.ParseError: If the XML is malformed
+        ValueError: If the document is not an Atom feed
+    """
+    events = ET.iterparse(io.BytesIO(content), events=("start", "end"))
+    _, root = next(events)
+    if root.tag != f"{_ATOM}feed":
+        raise ValueError(f"not an Atom feed: {root.tag}")
+
+    fetched_at = datetime.now().isoformat()
+    videos = []
+    for event, element in events:
+        if event == "end" and element.tag == f"{_ATOM}entry":
+            videos.append(_video_from_atom_entry(element, channel_name, fetched_at))
+            element.clear()
+
+    return videos
+
+
+def _video_from_atom_entry(entry: ET.Element, channel_name: str, fetched_at: str) -> Dict:
+    """Build a video dict from a parsed Atom <entry> element."""
+    video_id = entry.findtext(f"{_YT}videoId") or ""
+
+    url = ""
+    for link in entry.iterfind(f"{_ATOM}link"):
+        if link.get("rel", "alternate") == "alternate":
+            url = link.get("href", "")
+            break
+
+    description = ""
+    thumbnail = ""
+    views = None
+    group = entry.find(f"{_MEDIA}group")
+    if group is not None:
+        description = group.findtext(f"{_MEDIA}description") or ""
+        media_thumbnail = group.find(f"{_MEDIA}thumbnail")
+        if media_thumbnail is not None:
+            thumbnail = media_thumbnail.get("url", "")
+        statistics = group.find(f"{_MEDIA}community/{_MEDIA}statistics")
+        if statistics is not None:
+            try:
+                views = int(statistics.get("views", 0))
+            except ValueError:
+                pass
+
+    if not thumbnail and video_id:
+        thumbnail = f"https://img.youtube.com/vi/{video_id}/mqdefault.jpg"
+
+    return {
+        "platform": "youtube",
+        "type": "video",
+        "id": video_id or entry.findtext(f"{_ATOM}id") or "",
+        "title": entry.findtext(f"{_ATOM}title") or "",
+        "description": description[:500],  # Truncate long descriptions
+        "url": url,
+        "author": entry.findtext(f"{_ATOM}author/{_ATOM}name") or channel_name,
+        "channel_name": channel_name,
+        "published": entry.findtext(f"{_ATOM}published") or "",
+        "thumbnail": thumbnail,
+        "views": views,
+        "fetched_at": fetched_at,
+    }
+
+
+def parse_entries_feedparser(content: bytes, channel_name: str = "Unknown") -> List[Dict]:
+    """
+    Parse feed XML into video entries with feedparser.
+
+    Slower than parse_atom_entries, but tolerant of malformed and non-Atom
+    input.
+
+    Args:
+        content: The feed XML
+        channel_name: Display name for the channel
+
+    Returns:
+        List of video dictionaries
+    """
+    feed = feedparser.parse(content)
+
+    if feed.bozo:
+        print(f"⚠️  Warning: Feed parsing issue for {channel_name}")
+
+    videos = []
+    for entry in feed.entries:
+        video = {
+            "platform": "youtube",
+            "type": "video",
+            "id": entry.get("yt_videoid", entry.get("id", "")),
+            "title": entry.get("title", ""),
+            "description": entry.get("summary", "")[:500],  # Truncate long descriptions
+            "url": entry.get("link", ""),
+            "author": entry.get("author", channel_name),
+            "channel_name": channel_name,
+            "published": entry.get("published", ""),
+            "thumbnail": get_thumbnail(entry),
+            "views": get_view_count(entry),
+            "fetched_at": datetime.now().isoformat(),
+        }
+        videos.append(video)
+
+    return videos
+
+
+def parse_feed(
+    feed_url: str, channel_name: str = "Unknown", timeout: float = DEFAULT_FEED_TIMEOUT
+) -> List[Dict]:
     """
     Parse a YouTube RSS feed and return video entries.
 
     Args:
         feed_url: The RSS feed URL
         channel_name: Display name for the channel
+        timeout: Connect and read timeout in seconds
 
     Returns:
         List of video dictionaries
@@ -34,28 +277,7 @@ def parse_feed(feed_url: str, channel_name: str = "Unknown") -> List[Dict]:
     videos = []
 
     try:
-        feed = feedparser.parse(feed_url)
-
-        if feed.bozo:
-            print(f"⚠️  Warning: Feed parsing issue for {channel_name}")
-
-        for entry in feed.entries:
-            video = {
-                "platform": "youtube",
-                "type": "video",
-                "id": entry.get("yt_videoid", entry.get("id", "")),
-                "title": entry.get("title", ""),
-                "description": entry.get("summary", "")[:500],  # Truncate long descriptions
-                "url": entry.get("link", ""),
-                "author": entry.get("author", channel_name),
-                "channel_name": channel_name,
-                "published": entry.get("published", ""),
-                "thumbnail": get_thumbnail(entry),
-                "views": get_view_count(entry),
-                "fetched_at": datetime.now().isoformat(),
-            }
-            videos.append(video)
-
+        videos = parse_entries(download_feed(feed_url, timeout), channel_name)
     except Exception as e:
         print(f"❌ Error fetching YouTube feed for {channel_name}: {e}")
 
@@ -87,31 +309,133 @@ def get_view_count(entry: Dict) -> Optional[int]:
     return None
 
 
-def fetch_all_channels(channels: List[Dict]) -> List[Dict]:
+def fetch_channel(
+    channel: Dict,
+    timeout: float = DEFAULT_FEED_TIMEOUT,
+    cache: Optional[StateFile] = None,
+) -> Dict:
+    """
+    Fetch one channel's feed and report how it went.
+
+    Args:
+        channel: Channel dict with 'name' and 'channel_id'
+        timeout: Connect and read timeout in seconds
+        cache: Optional validator cache for conditional requests
+
+    Returns:
+        Dict with 'name', 'channel_id', 'videos', 'elapsed' (seconds),
+        'cache' ('not_modified', 'unchanged' or None) and 'error' (None on success)
+    """
+    name = channel.get("name", "Unknown")
+    channel_id = channel.get("channel_id", "")
+    feed_url = get_channel_feed_url(channel_id)
+    started = time.monotonic()
+    videos: List[Dict] = []
+    cache_status = None
+    error = None
+
+    try:
+        if cache is not None:
+            result = fetch_feed_cached(feed_url, name, cache, timeout)
+            videos, cache_status = result["videos"], result["cache"]
+        else:
+            videos = parse_entries(download_feed(feed_url, timeout), name)
+    except Exception as e:
+        error = str(e)
+
+    return {
+        "name": name,
+        "channel_id": channel_id,
+        "videos": videos,
+        "elapsed": time.monotonic() - started,
+        "cache": cache_status,
+        "error": error,
+    }
+
+
+def fetch_channels(
+    channels: List[Dict],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    timeout: float = DEFAULT_FEED_TIMEOUT,
+    cache_file: Optional[str] = None,
+) -> List[Dict]:
+    """
+    Fetch multiple channels concurrently.
+
+    Args:
+        channels: List of channel dicts with 'name' and 'channel_id'
+        max_workers: Maximum feeds in flight at once (1 fetches serially)
+        timeout: Per-feed connect and read timeout in seconds
+        cache_file: Optional path of the persistent feed validator cache
+
+    Returns:
+        One fetch_channel() report per channel with an ID, in input order
+    """
+    valid = []
+    for channel in channels:
+        if channel.get("channel_id"):
+            valid.append(channel)
+        else:
+            print(f"⚠️  Skipping {channel.get('name', 'Unknown')}: No channel ID provided")
+
+    if not valid:
+        return []
+
+    reports: List[Optional[Dict]] = [None] * len(valid)
+    cache = StateFile(cache_file) if cache_file else None
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(valid)))) as executor:
+        futures = {
+            executor.submit(fetch_channel, channel, timeout, cache): i
+            for i, channel in enumerate(valid)
+        }
+
+        for future in as_completed(futures):
+            report = future.result()
+            reports[futures[future]] = report
+
+            if report["error"]:
+                print(f"❌ YouTube: {report['name']} failed after {report['elapsed']:.1f}s: {report['error']}")
+            else:
+                cached = f", {report['cache'].replace('_', ' ')}" if report["cache"] else ""
+                print(f"📺 YouTube: {report['name']} - {len(report['videos'])} videos ({report['elapsed']:.1f}s{cached})")
+
+    if cache is not None:
+        cache.save()
+
+    return reports
+
+
+def fetch_all_channels(
+    channels: List[Dict],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    timeout: float = DEFAULT_FEED_TIMEOUT,
+    cache_file: Optional[str] = None,
+) -> List[Dict]:
     """
     Fetch videos from multiple YouTube channels.
 
     Args:
         channels: List of channel dicts with 'name' and 'channel_id'
+        max_workers: Maximum feeds in flight at once (1 fetches serially)
+        timeout: Per-feed connect and read timeout in seconds
+        cache_file: Optional path of the persistent feed validator cache
 
     Returns:
-        Combined list of all videos
+        Combined list of all videos, in channel order
     """
-    all_videos = []
+    started = time.monotonic()
+    reports = fetch_channels(channels, max_workers=max_workers, timeout=timeout, cache_file=cache_file)
 
-    for channel in channels:
-        name = channel.get("name", "Unknown")
-        channel_id = channel.get("channel_id", "")
-
-        if not channel_id:
-            print(f"⚠️  Skipping {name}: No channel ID provided")
-            continue
-
-        print(f"📺 Fetching YouTube: {name}...")
-        feed_url = get_channel_feed_url(channel_id)
-        videos = parse_feed(feed_url, name)
-        all_videos.extend(videos)
-        print(f"   Found {len(videos)} videos")
+    all_videos = []
+    for report in reports:
+        all_videos.extend(report["videos"])
+
+    failed = sum(1 for report in reports if report["error"])
+    print(
+        f"   Fetched {len(reports)} channels in {time.monotonic() - started:.1f}s"
+        + (f" ({failed} failed)" if failed else "")
+    )
 
     return all_videos
 
@@ -0,0 +1,58 @@
+"""Post storage backends for social media listening."""
+
+from .base import PostStore, post_key, sort_key
+from .json_store import JsonPostStore
+from .sqlite_store import SqlitePostStore
+from .query import PostIndex
+from .dedup import DedupIndex
+from .cache import PostSnapshot, SnapshotCache, get_snapshot_cache
+
+
+def create_store(
+    backend: str = "sqlite",
+    data_file: str = "social_data.json",
+    database_file: str = "social_data.db",
+) -> PostStore:
+    """
+    Create a post store for the configured backend.
+
+    Args:
+        backend: 'sqlite' or 'json'
+        data_file: JSON data file (the json backend's storage, imported by sqlite on first use)
+        database_file: SQLite database file
+
+    Returns:
+        A PostStore instance
+    """
+    if backend == "json":
+        return JsonPostStore(data_file)
+    if backend == "sqlite":
+        return SqlitePostStore(database_file, legacy_json_file=data_file)
+    raise ValueError(f"Unknown storage backend: {backend}")
+
+
+def get_store() -> PostStore:
+    """Create the post store configured in config.py (STORAGE_BACKEND, DATA_FILE, DATABASE_FILE)."""
+    import config
+
+    return create_store(
+        getattr(config, "STORAGE_BACKEND", "sqlite"),
+        getattr(config, "DATA_FILE", "social_data.json"),
+        getattr(config, "DATABASE_FILE", "social_data.db"),
+    )
+
+
+__all__ = [
+    "PostStore",
+    "post_key",
+    "sort_key",
+    "JsonPostStore",
+    "SqlitePostStore",
+    "DedupIndex",
+    "PostIndex",
+    "PostSnapshot",
+    "SnapshotCache",
+    "get_snapshot_cache",
+    "create_store",
+    "get_store",
+]
@@ -0,0 +1,190 @@
+"""
+Post Store Interface
+=====================
+Common interface implemented by every post storage backend.
+"""
+
+import base64
+import json
+from typing import Callable, List, Dict, Hashable, Iterable, Iterator, Optional, Set, Tuple
+
+
+PostKey = Tuple[str, str]
+
+#: A one-time data migration: given all posts, the posts to add and the keys to remove
+Migration = Callable[[List[Dict]], Tuple[List[Dict], List[PostKey]]]
+
+
+def post_key(post: Dict) -> PostKey:
+    """Return the (platform, id) key that uniquely identifies a post."""
+    return (post.get("platform", ""), str(post.get("id", "")))
+
+
+def sort_key(post: Dict) -> str:
+    """Return the value posts are ordered by (published, else fetched_at)."""
+    return post.get("published") or post.get("fetched_at", "") or ""
+
+
+def order_key(post: Dict) -> Tuple[str, str, str]:
+    """Total ordering key for posts: (sort key, platform, id)."""
+    return (sort_key(post), post.get("platform", ""), str(post.get("id", "")))
+
+
+def encode_cursor(post: Dict) -> str:
+    """Encode a post's position in the newest-first order as an opaque token."""
+    raw = json.dumps(list(order_key(post)), ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str, str]:
+    """
+    Decode a token produced by encode_cursor.
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        key = json.loads(raw.decode("utf-8"))
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+    if not (isinstance(key, list) and len(key) == 3 and all(isinstance(k, str) for k in key)):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return tuple(key)
+
+
+def empty_data() -> Dict:
+    """Return the document shape used when nothing has been stored yet."""
+    return {
+        "posts": [],
+        "last_updated": None,
+        "stats": {},
+    }
+
+
+class PostStore:
+    """Base class for post storage backends."""
+
+    #: Path of the file backing the store
+    path: str = ""
+
+    def version(self) -> Hashable:
+        """
+        Return a cheap token that changes whenever the stored data changes.
+
+        Used by caches to decide whether a reload is needed.
+        """
+        raise NotImplementedError
+
+    def load(self) -> Dict:
+        """
+        Load the full document.
+
+        Returns:
+            Dict with 'posts', 'last_updated' and 'stats'
+        """
+        raise NotImplementedError
+
+    def save(self, data: Dict):
+        """
+        Replace the stored document with the given one.
+
+        Args:
+            data: Dict with 'posts', 'last_updated' and 'stats'
+        """
+        raise NotImplementedError
+
+    def apply_changes(
+        self,
+        added: List[Dict],
+        removed: List[PostKey],
+        stats: Optional[Dict] = None,
+        last_updated: Optional[str] = None,
+    ):
+        """
+        Persist the changes made by a fetch.
+
+        Posts whose (platform, id) key is already stored are ignored.
+        Removals are applied after additions.
+
+        Args:
+            added: New posts to insert
+            removed: (platform, id) keys of posts to delete
+            stats: Replacement statistics, if any
+            last_updated: Timestamp of the update
+        """
+        raise NotImplementedError
+
+    def query(
+        self,
+        platform: Optional[str] = None,
+        post_type: Optional[str] = None,
+        author: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ) -> Dict:
+        """
+        Filter and paginate posts, newest first.
+
+        Pass the previous page's 'next_cursor' as cursor to continue after
+        it; 'total' always counts every post matching the filters.
+
+        Returns:
+            Dict with 'posts', 'total', 'limit', 'offset', 'next_cursor'
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        raise NotImplementedError
+
+    def iter_keys(self) -> Iterator[PostKey]:
+        """Yield the (platform, id) key of every stored post."""
+        for post in self.load().get("posts", []):
+            yield post_key(post)
+
+    def applied_migrations(self) -> Set[str]:
+        """Names of the data migrations already applied to the store."""
+        raise NotImplementedError
+
+    def mark_migration(self, name: str):
+        """Record a data migration as applied."""
+        raise NotImplementedError
+
+    def run_migration(self, name: str, migrate: Migration) -> bool:
+        """
+        Apply a one-time data migration unless it is recorded as applied.
+
+        Args:
+            name: Unique name the migration is recorded under
+            migrate: Function returning the posts to add and the keys to
+                remove; a post is replaced by removing its old key and
+                adding it under the new one
+
+        Returns:
+            Whether the migration ran and changed any posts
+        """
+        if name in self.applied_migrations():
+            return False
+        added, removed = migrate(self.load().get("posts", []))
+        if added or removed:
+            self.apply_changes(added, removed)
+        self.mark_migration(name)
+        return bool(added or removed)
+
+    def get_meta(self) -> Dict:
+        """
+        Get the document metadata without loading posts.
+
+        Returns:
+            Dict with 'last_updated', 'stats' and 'total_posts'
+        """
+        data = self.load()
+        return {
+            "last_updated": data.get("last_updated"),
+            "stats": data.get("stats", {}),
+            "total_posts": len(data.get("posts", [])),
+        }
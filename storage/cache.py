@@ -0,0 +1,140 @@
+"""
+Post Snapshot Cache
+====================
+Keeps a parsed, read-only copy of a store in memory and reloads it only
+when the store's version token changes. Shared by every reader in the
+process so that one API request never parses the data more than once.
+"""
+
+import os
+import threading
+import time
+from typing import List, Dict, Hashable, Optional
+
+from .base import PostStore
+from .query import PostIndex
+
+
+class PostSnapshot:
+    """An immutable view of the store at one version."""
+
+    def __init__(self, version: Hashable, data: Dict):
+        """
+        Build a snapshot from a loaded document.
+
+        Args:
+            version: The store version the data was loaded at
+            data: Dict with 'posts', 'last_updated' and 'stats'
+        """
+        self.version = version
+        self.data = data
+        self.posts: List[Dict] = data.get("posts", [])
+        # Built once per reload so queries never scan or sort the corpus
+        self.index = PostIndex(self.posts)
+
+    def get_meta(self) -> Dict:
+        """Get 'last_updated', 'stats' and 'total_posts'."""
+        return {
+            "last_updated": self.data.get("last_updated"),
+            "stats": self.data.get("stats", {}),
+            "total_posts": len(self.posts),
+        }
+
+    def query(
+        self,
+        platform: Optional[str] = None,
+        post_type: Optional[str] = None,
+        author: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ) -> Dict:
+        """
+        Filter and paginate posts, newest first.
+
+        Returns:
+            Dict with 'posts', 'total', 'limit', 'offset', 'next_cursor'
+        """
+        return self.index.query(
+            platform=platform,
+            post_type=post_type,
+            author=author,
+            date_from=date_from,
+            date_to=date_to,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+
+
+class SnapshotCache:
+    """Thread-safe holder of the current PostSnapshot for a store."""
+
+    def __init__(self, store: PostStore, check_interval: float = 1.0):
+        """
+        Initialize the cache.
+
+        Args:
+            store: The store to snapshot
+            check_interval: Seconds between version checks; 0 checks on every read
+        """
+        self.store = store
+        self.check_interval = check_interval
+        self._snapshot: Optional[PostSnapshot] = None
+        self._checked_at = 0.0
+        self._reload_lock = threading.Lock()
+
+    def get(self) -> PostSnapshot:
+        """
+        Return the current snapshot, reloading it if the store has changed.
+
+        While one thread reloads, other threads keep getting the previous
+        snapshot instead of waiting.
+        """
+        snapshot = self._snapshot
+        now = time.monotonic()
+        if snapshot is not None and now - self._checked_at < self.check_interval:
+            return snapshot
+
+        version = self.store.version()
+        if snapshot is not None and snapshot.version == version:
+            self._checked_at = now
+            return snapshot
+
+        # Only the first load blocks; later reloads serve the stale snapshot
+        if not self._reload_lock.acquire(blocking=snapshot is None):
+            return snapshot
+
+        try:
+            current = self._snapshot
+            if current is not None and current.version == version:
+                return current
+
+            # The version is read before loading, so a write that lands
+            # mid-load only causes one extra reload later.
+            self._snapshot = PostSnapshot(version, self.store.load())
+            self._checked_at = time.monotonic()
+            return self._snapshot
+        finally:
+            self._reload_lock.release()
+
+    def invalidate(self):
+        """Force the next read to check the store version."""
+        self._checked_at = 0.0
+
+
+_caches: Dict[str, SnapshotCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_snapshot_cache(store: PostStore) -> SnapshotCache:
+    """Get the process-wide cache for the file backing a store."""
+    key = f"{type(store).__name__}:{os.path.abspath(store.path)}"
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = SnapshotCache(store)
+            _caches[key] = cache
+        return cache
@@ -0,0 +1,131 @@
+"""
+Dedup Index
+============
+Tracks which (platform, id) keys are already stored so that each fetch
+only pays for the posts it brings in, not for the size of the store.
+
+The keys are taken from posts the caller has already loaded (or read
+from the store once) and then kept up to date as posts are added and
+trimmed. They are only read again if another writer changed the store.
+"""
+
+import threading
+from typing import List, Dict, Hashable, Iterable, Iterator, Optional, Set
+
+from .base import PostStore, PostKey, post_key
+
+
+class DedupIndex:
+    """Stored post keys, maintained incrementally alongside a store."""
+
+    def __init__(self, store: PostStore, posts: Optional[Iterable[Dict]] = None):
+        """
+        Initialize the index.
+
+        Args:
+            store: The store whose keys are indexed
+            posts: The store's posts, if the caller has loaded them; otherwise
+                the keys are read from the store on the first lookup
+        """
+        self.store = store
+        # Fetch stages read the index while the listener updates it
+        self._lock = threading.RLock()
+
+        self._version: Hashable = None
+        self._loaded = False
+        self._keys: Set[PostKey] = set()
+        if posts is not None:
+            self._version = store.version()
+            self._keys = {post_key(post) for post in posts}
+            self._loaded = True
+
+        # Changes made through this index that the store may not have yet
+        self._pending: Set[PostKey] = set()
+        self._removed: Set[PostKey] = set()
+
+    def _ensure_current(self):
+        """(Re)load when first used or when another writer changed the store."""
+        version = self.store.version()
+        if self._loaded and version == self._version:
+            return
+
+        self._keys = set(self.store.iter_keys())
+        self._version = version
+        self._loaded = True
+
+    def filter_new(self, posts: List[Dict]) -> List[Dict]:
+        """
+        Return the posts whose keys are not stored or already seen, and
+        record their keys as seen.
+
+        Args:
+            posts: Candidate posts, possibly with duplicates among them
+
+        Returns:
+            Unique new posts, in their original order
+        """
+        if not posts:
+            return []
+
+        with self._lock:
+            self._ensure_current()
+
+            candidates: Dict[PostKey, Dict] = {}
+            for post in posts:
+                key = post_key(post)
+                if key in candidates or key in self._pending:
+                    continue
+                candidates[key] = post
+
+            stored = {key for key in candidates if key in self._keys and key not in self._removed}
+
+            unique = []
+            for key, post in candidates.items():
+                if key not in stored:
+                    self._pending.add(key)
+                    self._removed.discard(key)
+                    unique.append(post)
+
+            return unique
+
+    def iter_unstored(self, posts: Iterable[Dict]) -> Iterator[Dict]:
+        """
+        Drop posts that are already stored as they arrive, so a fetch does
+        not hold on to them. Nothing is recorded as seen; filter_new()
+        still has to accept the posts that come through.
+
+        Args:
+            posts: Candidate posts, e.g. a monitor's search iterator
+
+        Yields:
+            Posts whose keys are not stored
+        """
+        checked = False
+        for post in posts:
+            key = post_key(post)
+            with self._lock:
+                if not checked:
+                    self._ensure_current()
+                    checked = True
+                stored = key in self._keys and key not in self._removed
+            if not stored:
+                yield post
+
+    def discard(self, keys: Iterable[PostKey]):
+        """Record that posts with these keys were removed."""
+        with self._lock:
+            for key in keys:
+                self._pending.discard(key)
+                self._removed.add(key)
+
+    def commit(self):
+        """Fold pending changes in once the store has persisted them."""
+        with self._lock:
+            if not self._loaded:
+                return
+
+            self._keys.update(self._pending)
+            self._keys.difference_update(self._removed)
+            self._pending.clear()
+            self._removed.clear()
+            self._version = self.store.version()
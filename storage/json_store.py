@@ -0,0 +1,142 @@
+"""
+JSON Post Store
+================
+Legacy backend that keeps every post in a single JSON document.
+Every write rewrites the whole file; kept for compatibility and for
+small installations that want a human-readable data file.
+"""
+
+import json
+import os
+from typing import List, Dict, Hashable, Optional, Set
+
+from .base import (
+    PostStore, PostKey, post_key, sort_key, order_key, encode_cursor, decode_cursor, empty_data,
+)
+
+
+class JsonPostStore(PostStore):
+    """Post store backed by social_data.json."""
+
+    def __init__(self, data_file: str = "social_data.json"):
+        """
+        Initialize the JSON store.
+
+        Args:
+            data_file: Path to the JSON data file
+        """
+        self.data_file = data_file
+        self.path = data_file
+
+    def version(self) -> Hashable:
+        """Return the data file's modification time and size."""
+        try:
+            stat = os.stat(self.data_file)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def load(self) -> Dict:
+        """Load all data from the JSON file."""
+        if os.path.exists(self.data_file):
+            try:
+                with open(self.data_file, "r", encoding="utf-8") as f:
+                    return json.load(f)
+            except (json.JSONDecodeError, IOError):
+                pass
+
+        return empty_data()
+
+    def save(self, data: Dict):
+        """Save data to the JSON file."""
+        with open(self.data_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+    def apply_changes(
+        self,
+        added: List[Dict],
+        removed: List[PostKey],
+        stats: Optional[Dict] = None,
+        last_updated: Optional[str] = None,
+    ):
+        """Apply a fetch's changes by rewriting the whole file."""
+        data = self.load()
+        posts = data.setdefault("posts", [])
+
+        existing = {post_key(post) for post in posts}
+        for post in added:
+            key = post_key(post)
+            if key not in existing:
+                existing.add(key)
+                posts.append(post)
+
+        if removed:
+            removed_keys = set(removed)
+            data["posts"] = [p for p in posts if post_key(p) not in removed_keys]
+
+        if stats is not None:
+            data["stats"] = stats
+        if last_updated is not None:
+            data["last_updated"] = last_updated
+
+        self.save(data)
+
+    def applied_migrations(self) -> Set[str]:
+        """Read the migration names recorded in the document."""
+        return set(self.load().get("migrations", []))
+
+    def mark_migration(self, name: str):
+        """Record a migration name in the document."""
+        data = self.load()
+        migrations = data.setdefault("migrations", [])
+        if name not in migrations:
+            migrations.append(name)
+            self.save(data)
+
+    def query(
+        self,
+        platform: Optional[str] = None,
+        post_type: Optional[str] = None,
+        author: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ) -> Dict:
+        """Filter and paginate posts by scanning the whole document."""
+        after = decode_cursor(cursor) if cursor else None
+        filtered = self.load().get("posts", [])
+
+        if platform:
+            filtered = [p for p in filtered if p.get("platform") == platform]
+
+        if post_type:
+            filtered = [p for p in filtered if p.get("type") == post_type]
+
+        if author:
+            filtered = [p for p in filtered if author.lower() in (p.get("author") or "").lower()]
+
+        if date_from:
+            filtered = [p for p in filtered if sort_key(p) >= date_from]
+
+        if date_to:
+            filtered = [p for p in filtered if sort_key(p) <= date_to]
+
+        # Sort by published date (newest first)
+        filtered.sort(key=order_key, reverse=True)
+        total = len(filtered)
+
+        if after:
+            filtered = [p for p in filtered if order_key(p) < after]
+
+        page = filtered[offset:offset + limit]
+        has_more = offset + limit < len(filtered)
+
+        return {
+            "posts": page,
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "next_cursor": encode_cursor(page[-1]) if page and has_more else None,
+        }
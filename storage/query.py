@@ -0,0 +1,199 @@
+"""
+Post Query Index
+=================
+In-memory indexes over a snapshot of posts for fast filtered pagination.
+
+Posts are ordered once, newest first, and every index refers to posts by
+their position in that order:
+
+- a sorted list of sort keys, bisected for date ranges
+- one posting list of positions per platform, per type and per
+  (platform, type) pair
+- one posting list per distinct (lower-cased) author, plus a token index
+  from author words to authors to narrow substring searches
+
+Posting lists are kept in ascending position order, so the intersection
+of several filters is produced already sorted and a page is a slice.
+Cursors encode a post's (sort key, platform, id), which bisects straight
+to the position after it, so deep pages cost the same as the first.
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+from typing import List, Dict, Iterator, Optional, Tuple
+
+from .base import order_key, encode_cursor, decode_cursor
+
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+class PostIndex:
+    """Sorted, indexed view of a list of posts."""
+
+    def __init__(self, posts: List[Dict]):
+        """
+        Build the indexes.
+
+        Args:
+            posts: All posts, in any order
+        """
+        self.posts: List[Dict] = sorted(posts, key=order_key, reverse=True)
+
+        # Ascending copy of the order keys, for bisecting
+        self._keys_asc: List[Tuple[str, str, str]] = [order_key(p) for p in reversed(self.posts)]
+
+        self._by_platform: Dict[str, List[int]] = {}
+        self._by_type: Dict[str, List[int]] = {}
+        self._by_platform_type: Dict[Tuple[str, str], List[int]] = {}
+        self._by_author: Dict[str, List[int]] = {}
+        self._author_tokens: Dict[str, List[str]] = {}
+
+        for position, post in enumerate(self.posts):
+            self._by_platform.setdefault(post.get("platform"), []).append(position)
+            self._by_type.setdefault(post.get("type"), []).append(position)
+            self._by_platform_type.setdefault(
+                (post.get("platform"), post.get("type")), []
+            ).append(position)
+
+            author = (post.get("author") or "").lower()
+            author_positions = self._by_author.get(author)
+            if author_positions is None:
+                author_positions = self._by_author[author] = []
+                for token in set(_TOKEN_RE.findall(author)):
+                    self._author_tokens.setdefault(token, []).append(author)
+            author_positions.append(position)
+
+        self._author_matches: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.posts)
+
+    def _date_range(self, date_from: Optional[str], date_to: Optional[str]) -> Tuple[int, int]:
+        """Positions [lo, hi) of posts whose sort key is within the dates."""
+        count = len(self.posts)
+        lo, hi = 0, count
+
+        if date_to:
+            # Keys <= date_to sort before (date_to + anything longer)
+            lo = count - bisect_right(self._keys_asc, (date_to, "\uffff", "\uffff"))
+        if date_from:
+            hi = count - bisect_left(self._keys_asc, (date_from, "", ""))
+
+        return lo, max(lo, hi)
+
+    def _seek(self, cursor: Optional[str]) -> int:
+        """First position strictly after the cursor (0 without one)."""
+        if not cursor:
+            return 0
+        return len(self.posts) - bisect_left(self._keys_asc, decode_cursor(cursor))
+
+    def _author_positions(self, author: str) -> List[int]:
+        """Positions of posts whose author contains the substring."""
+        author = author.lower()
+        cached = self._author_matches.get(author)
+        if cached is not None:
+            return cached
+
+        # Any whole word of the query must be a word (or part of one) of a
+        # matching author, so use the rarest word's authors as candidates.
+        tokens = _TOKEN_RE.findall(author)
+        exact = [self._author_tokens.get(t) for t in tokens[1:-1]]
+        if exact and all(exact):
+            candidates = min(exact, key=len)
+        elif exact:
+            candidates = []
+        else:
+            candidates = self._by_author.keys()
+
+        merged: List[int] = []
+        for name in candidates:
+            if author in name:
+                merged.extend(self._by_author[name])
+        merged.sort()
+
+        if len(self._author_matches) > 256:
+            self._author_matches.clear()
+        self._author_matches[author] = merged
+        return merged
+
+    @staticmethod
+    def _intersect(lists: List[List[int]], lo: int, hi: int) -> Iterator[int]:
+        """Yield positions in [lo, hi) present in every list, ascending."""
+        lists = sorted(lists, key=len)
+        smallest, others = lists[0], lists[1:]
+        # Both sides ascend, so each other list is searched from where the
+        # previous match left off.
+        cursors = [bisect_left(other, lo) for other in others]
+
+        for i in range(bisect_left(smallest, lo), len(smallest)):
+            position = smallest[i]
+            if position >= hi:
+                break
+
+            for n, other in enumerate(others):
+                cursors[n] = bisect_left(other, position, cursors[n])
+                if cursors[n] == len(other) or other[cursors[n]] != position:
+                    break
+            else:
+                yield position
+
+    def query(
+        self,
+        platform: Optional[str] = None,
+        post_type: Optional[str] = None,
+        author: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ) -> Dict:
+        """
+        Filter and paginate posts, newest first.
+
+        Returns:
+            Dict with 'posts', 'total', 'limit', 'offset', 'next_cursor'
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        lo, hi = self._date_range(date_from, date_to)
+        start = max(lo, self._seek(cursor))
+
+        lists: List[List[int]] = []
+        if platform and post_type:
+            lists.append(self._by_platform_type.get((platform, post_type), []))
+        elif platform:
+            lists.append(self._by_platform.get(platform, []))
+        elif post_type:
+            lists.append(self._by_type.get(post_type, []))
+        if author:
+            lists.append(self._author_positions(author))
+
+        if not lists:
+            total = hi - lo
+            first, end = min(start, hi) + offset, hi
+            positions = range(first, min(end, first + limit))
+        elif len(lists) == 1:
+            only = lists[0]
+            end = bisect_left(only, hi)
+            total = end - bisect_left(only, lo)
+            first = bisect_left(only, start) + offset
+            positions = only[first:min(end, first + limit)]
+        else:
+            matched = list(self._intersect(lists, lo, hi))
+            total = end = len(matched)
+            first = bisect_left(matched, start) + offset
+            positions = matched[first:first + limit]
+
+        posts = [self.posts[p] for p in positions]
+        has_more = first + len(posts) < end
+
+        return {
+            "posts": posts,
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "next_cursor": encode_cursor(posts[-1]) if posts and has_more else None,
+        }
@@ -0,0 +1,310 @@
+"""
+SQLite Post Store
+==================
+Stores one row per post so that a fetch only inserts its new posts and
+a query only reads the rows it returns.
+
+The full post dict is kept as JSON in the ``data`` column; the columns
+used for filtering and ordering are extracted alongside it and indexed.
+"""
+
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+from typing import List, Dict, Hashable, Iterable, Iterator, Optional, Set
+
+from .base import (
+    PostStore, PostKey, Migration, post_key, sort_key, encode_cursor, decode_cursor, empty_data,
+)
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    platform TEXT NOT NULL,
+    id TEXT NOT NULL,
+    type TEXT NOT NULL DEFAULT '',
+    author_lower TEXT NOT NULL DEFAULT '',
+    sort_key TEXT NOT NULL DEFAULT '',
+    data TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS ux_posts_platform_id ON posts (platform, id);
+CREATE INDEX IF NOT EXISTS ix_posts_sort_key ON posts (sort_key, platform, id);
+CREATE INDEX IF NOT EXISTS ix_posts_author ON posts (author_lower);
+CREATE INDEX IF NOT EXISTS ix_posts_type ON posts (type, sort_key);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def _post_row(post: Dict) -> tuple:
+    """Convert a post dict to a posts table row."""
+    platform, post_id = post_key(post)
+    return (
+        platform,
+        post_id,
+        post.get("type") or "",
+        (post.get("author") or "").lower(),
+        sort_key(post),
+        json.dumps(post, ensure_ascii=False),
+    )
+
+
+class SqlitePostStore(PostStore):
+    """Post store backed by a SQLite database."""
+
+    def __init__(self, db_file: str = "social_data.db", legacy_json_file: Optional[str] = None):
+        """
+        Initialize the SQLite store, creating the schema if needed.
+
+        Args:
+            db_file: Path to the SQLite database file
+            legacy_json_file: social_data.json to import on first use, if present
+        """
+        self.db_file = db_file
+        self.path = db_file
+        self.legacy_json_file = legacy_json_file
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+        self._import_legacy_json()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, committing on success and always closing it."""
+        conn = sqlite3.connect(self.db_file, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _import_legacy_json(self):
+        """Import an existing social_data.json into an empty database once."""
+        if not self.legacy_json_file or not os.path.exists(self.legacy_json_file):
+            return
+
+        with self._connect() as conn:
+            if self._get_meta_value(conn, "legacy_imported"):
+                return
+
+            row_count = conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+            if row_count == 0:
+                try:
+                    with open(self.legacy_json_file, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                except (json.JSONDecodeError, IOError) as e:
+                    print(f"⚠️  Could not import {self.legacy_json_file}: {e}")
+                    data = empty_data()
+
+                self._insert_posts(conn, data.get("posts", []))
+                self._write_meta(conn, data.get("stats", {}), data.get("last_updated"))
+                self._bump_version(conn)
+                print(f"📦 Imported {len(data.get('posts', []))} posts from {self.legacy_json_file}")
+
+            self._set_meta_value(conn, "legacy_imported", "1")
+
+    @staticmethod
+    def _get_meta_value(conn: sqlite3.Connection, key: str) -> Optional[str]:
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _set_meta_value(conn: sqlite3.Connection, key: str, value: Optional[str]):
+        conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    def _bump_version(self, conn: sqlite3.Connection):
+        """Increment the change counter; call inside every write transaction."""
+        conn.execute(
+            "INSERT INTO meta (key, value) VALUES ('version', '1') "
+            "ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1"
+        )
+
+    def _write_meta(self, conn: sqlite3.Connection, stats: Optional[Dict], last_updated: Optional[str]):
+        if stats is not None:
+            self._set_meta_value(conn, "stats", json.dumps(stats, ensure_ascii=False))
+        if last_updated is not None:
+            self._set_meta_value(conn, "last_updated", last_updated)
+
+    @staticmethod
+    def _insert_posts(conn: sqlite3.Connection, posts: List[Dict]) -> int:
+        """Insert posts, skipping any whose (platform, id) already exists."""
+        before = conn.total_changes
+        conn.executemany(
+            "INSERT OR IGNORE INTO posts (platform, id, type, author_lower, sort_key, data) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [_post_row(post) for post in posts],
+        )
+        return conn.total_changes - before
+
+    def load(self) -> Dict:
+        """Load all posts and metadata, in insertion order."""
+        with self._connect() as conn:
+            posts = [
+                json.loads(row[0])
+                for row in conn.execute("SELECT data FROM posts ORDER BY rowid")
+            ]
+            stats = self._get_meta_value(conn, "stats")
+            last_updated = self._get_meta_value(conn, "last_updated")
+
+        return {
+            "posts": posts,
+            "last_updated": last_updated,
+            "stats": json.loads(stats) if stats else {},
+        }
+
+    def save(self, data: Dict):
+        """Replace every stored post with the given document."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM posts")
+            self._insert_posts(conn, data.get("posts", []))
+            self._write_meta(conn, data.get("stats", {}), data.get("last_updated"))
+            self._bump_version(conn)
+
+    def apply_changes(
+        self,
+        added: List[Dict],
+        removed: List[PostKey],
+        stats: Optional[Dict] = None,
+        last_updated: Optional[str] = None,
+    ):
+        """Insert new posts and delete trimmed ones in a single transaction."""
+        with self._connect() as conn:
+            self._apply(conn, added, removed)
+            self._write_meta(conn, stats, last_updated)
+            self._bump_version(conn)
+
+    def _apply(self, conn: sqlite3.Connection, added: List[Dict], removed: List[PostKey]):
+        if added:
+            self._insert_posts(conn, added)
+        if removed:
+            conn.executemany(
+                "DELETE FROM posts WHERE platform = ? AND id = ?",
+                [(platform, str(post_id)) for platform, post_id in removed],
+            )
+
+    def applied_migrations(self) -> Set[str]:
+        """Read the migration names recorded in the meta table."""
+        with self._connect() as conn:
+            value = self._get_meta_value(conn, "migrations")
+        return set(json.loads(value)) if value else set()
+
+    def mark_migration(self, name: str):
+        """Record a migration name in the meta table."""
+        with self._connect() as conn:
+            self._mark_migration(conn, name)
+
+    def _mark_migration(self, conn: sqlite3.Connection, name: str):
+        value = self._get_meta_value(conn, "migrations")
+        migrations = json.loads(value) if value else []
+        if name not in migrations:
+            migrations.append(name)
+            self._set_meta_value(conn, "migrations", json.dumps(migrations))
+
+    def run_migration(self, name: str, migrate: Migration) -> bool:
+        """Apply a one-time migration and record it in the same transaction."""
+        if name in self.applied_migrations():
+            return False
+        added, removed = migrate(self.load().get("posts", []))
+        with self._connect() as conn:
+            self._apply(conn, added, removed)
+            self._mark_migration(conn, name)
+            if added or removed:
+                self._bump_version(conn)
+        return bool(added or removed)
+
+    def iter_keys(self) -> Iterator[PostKey]:
+        """Yield every stored key, reading only the unique index."""
+        with self._connect() as conn:
+            yield from conn.execute("SELECT platform, id FROM posts")
+
+    def version(self) -> Hashable:
+        """Return the change counter maintained by every write."""
+        with self._connect() as conn:
+            return self._get_meta_value(conn, "version")
+
+    def query(
+        self,
+        platform: Optional[str] = None,
+        post_type: Optional[str] = None,
+        author: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ) -> Dict:
+        """Filter and paginate posts using the database indexes."""
+        after = decode_cursor(cursor) if cursor else None
+        clauses = []
+        params: List = []
+
+        if platform:
+            clauses.append("platform = ?")
+            params.append(platform)
+
+        if post_type:
+            clauses.append("type = ?")
+            params.append(post_type)
+
+        if author:
+            clauses.append("instr(author_lower, ?) > 0")
+            params.append(author.lower())
+
+        if date_from:
+            clauses.append("sort_key >= ?")
+            params.append(date_from)
+
+        if date_to:
+            clauses.append("sort_key <= ?")
+            params.append(date_to)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        page_clauses, page_params = list(clauses), list(params)
+        if after:
+            # Seek past the cursor using the (sort_key, platform, id) index
+            page_clauses.append("(sort_key, platform, id) < (?, ?, ?)")
+            page_params.extend(after)
+        page_where = f"WHERE {' AND '.join(page_clauses)}" if page_clauses else ""
+
+        with self._connect() as conn:
+            total = conn.execute(f"SELECT COUNT(*) FROM posts {where}", params).fetchone()[0]
+            # Fetch one extra row to learn whether another page follows
+            rows = conn.execute(
+                f"SELECT data FROM posts {page_where} "
+                "ORDER BY sort_key DESC, platform DESC, id DESC LIMIT ? OFFSET ?",
+                page_params + [limit + 1, offset],
+            ).fetchall()
+
+        posts = [json.loads(row[0]) for row in rows[:limit]]
+
+        return {
+            "posts": posts,
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "next_cursor": encode_cursor(posts[-1]) if len(rows) > limit else None,
+        }
+
+    def get_meta(self) -> Dict:
+        """Get metadata and the post count without reading any post rows."""
+        with self._connect() as conn:
+            total = conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+            stats = self._get_meta_value(conn, "stats")
+            last_updated = self._get_meta_value(conn, "last_updated")
+
+        return {
+            "last_updated": last_updated,
+            "stats": json.loads(stats) if stats else {},
+            "total_posts": total,
+        }
@@ -0,0 +1,93 @@
+"""
+LinkedIn Monitor Tests
+=======================
+Paging company shares back to the last-seen post, against a fake client.
+"""
+
+from platforms.linkedin import LinkedInMonitor
+from platforms.state import StateFile
+
+
+ORG_ID = "1001"
+
+
+class FakeResponse:
+    def __init__(self, body):
+        self.body = body
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.body
+
+
+class FakeHttp:
+    """Serves one organization's shares, newest first, by start/count."""
+
+    def __init__(self, shares):
+        self.shares = shares
+        self.calls = []
+
+    def get(self, url, headers=None, params=None):
+        self.calls.append(dict(params))
+        start, count = params["start"], params["count"]
+        return FakeResponse({"elements": self.shares[start:start + count]})
+
+
+def make_shares(count: int, newest: int = 100_000):
+    return [
+        {"id": f"share-{newest - i}", "created": {"time": (newest - i) * 1000}, "text": {"text": "t"}}
+        for i in range(count)
+    ]
+
+
+def make_monitor(shares, tmp_path, last_seen=None, max_pages=3):
+    path = str(tmp_path / "last_seen.json")
+    if last_seen is not None:
+        state = StateFile(path)
+        state.set(ORG_ID, last_seen)
+        state.save()
+    http = FakeHttp(shares)
+    return LinkedInMonitor("token", http=http, last_seen_file=path, max_pages=max_pages), http
+
+
+def last_seen_of(share):
+    return {"id": share["id"], "created": share["created"]["time"]}
+
+
+def test_first_fetch_reads_one_page_and_records_newest(tmp_path):
+    shares = make_shares(80)
+    monitor, http = make_monitor(shares, tmp_path)
+
+    posts = monitor.get_company_posts(ORG_ID, limit=25)
+    monitor.commit_state()
+
+    assert len(posts) == 25 and len(http.calls) == 1
+    assert StateFile(str(tmp_path / "last_seen.json")).get(ORG_ID) == last_seen_of(shares[0])
+
+
+def test_pages_back_to_last_seen_post(tmp_path):
+    shares = make_shares(80)
+    monitor, http = make_monitor(shares, tmp_path, last_seen=last_seen_of(shares[40]))
+
+    posts = monitor.get_company_posts(ORG_ID, limit=25)
+    monitor.commit_state()
+
+    assert [post["id"] for post in posts] == [share["id"] for share in shares[:40]]
+    assert [call["start"] for call in http.calls] == [0, 25]
+    assert StateFile(str(tmp_path / "last_seen.json")).get(ORG_ID) == last_seen_of(shares[0])
+
+
+def test_keeps_last_seen_when_max_pages_cuts_paging_short(tmp_path, capsys):
+    shares = make_shares(200)
+    old = last_seen_of(shares[150])
+    monitor, http = make_monitor(shares, tmp_path, last_seen=old, max_pages=2)
+
+    posts = monitor.get_company_posts(ORG_ID, limit=25)
+    monitor.commit_state()
+
+    assert len(posts) == 50 and len(http.calls) == 2
+    assert "keeping its last-seen post" in capsys.readouterr().out
+    # The next fetch still pages back to the old post
+    assert StateFile(str(tmp_path / "last_seen.json")).get(ORG_ID) == old
@@ -0,0 +1,116 @@
+"""
+Rate Limit Tests
+=================
+Pacing from x-rate-limit-* headers in the shared HTTP client, and how the
+Twitter monitor defers work when a limit would hold it back too long.
+"""
+
+import json
+import time
+
+import pytest
+import requests
+
+from platforms.http_client import HttpClient
+from platforms.rate_limit import RateLimited
+from platforms.twitter import TwitterMonitor
+
+
+SEARCH_URL = "https://api.twitter.com/2/tweets/search/recent"
+
+
+def make_response(status: int = 200, body=None, remaining=None, reset_in=None) -> requests.Response:
+    """Build a response carrying the given x-rate-limit-* headers."""
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(body if body is not None else {}).encode("utf-8")
+    if remaining is not None:
+        response.headers["x-rate-limit-limit"] = "180"
+        response.headers["x-rate-limit-remaining"] = str(remaining)
+        response.headers["x-rate-limit-reset"] = str(int(time.time() + reset_in))
+    return response
+
+
+class FakeSession:
+    """Stands in for requests.Session, answering with canned responses."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def request(self, method, url, timeout=None, **kwargs):
+        self.calls.append((method, url, kwargs.get("params")))
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record sleeps instead of waiting."""
+    waits = []
+    monkeypatch.setattr(time, "sleep", waits.append)
+    return waits
+
+
+def make_client(responses, max_wait: float = 30) -> HttpClient:
+    client = HttpClient(max_retries=1, backoff_factor=0, rate_limit_max_wait=max_wait)
+    client.session = FakeSession(responses)
+    return client
+
+
+def test_exhausted_window_waits_for_reset(sleeps):
+    client = make_client([make_response(remaining=0, reset_in=10), make_response()])
+
+    client.get(SEARCH_URL)
+    client.get(SEARCH_URL)
+
+    assert len(client.session.calls) == 2
+    assert len(sleeps) == 1 and 8 < sleeps[0] <= 11
+
+
+def test_remaining_calls_go_out_immediately(sleeps):
+    client = make_client([make_response(remaining=150, reset_in=900), make_response()])
+
+    client.get(SEARCH_URL)
+    client.get(SEARCH_URL)
+
+    assert sleeps == []
+
+
+def test_wait_beyond_max_wait_raises_rate_limited(sleeps):
+    client = make_client([make_response(remaining=0, reset_in=600)], max_wait=30)
+
+    client.get(SEARCH_URL)
+    with pytest.raises(RateLimited) as raised:
+        client.get(SEARCH_URL)
+
+    assert raised.value.retry_in > 30
+    assert len(client.session.calls) == 1
+    assert sleeps == []
+
+
+def test_429_is_retried_after_the_reset(sleeps):
+    client = make_client([make_response(429, remaining=0, reset_in=5), make_response()])
+
+    response = client.get(SEARCH_URL)
+
+    assert response.status_code == 200
+    assert len(client.session.calls) == 2
+    assert len(sleeps) == 1 and 3 < sleeps[0] <= 6
+
+
+def test_twitter_defers_search_and_keeps_cursor(sleeps, tmp_path, capsys):
+    first_page = {
+        "data": [{"id": "20", "text": "payout", "author_id": "u"}],
+        "includes": {"users": [{"id": "u", "username": "trader", "name": "Trader"}]},
+        "meta": {"newest_id": "20", "next_token": "page2"},
+    }
+    client = make_client([make_response(body=first_page, remaining=0, reset_in=600)])
+    monitor = TwitterMonitor("token", http=client, cursor_file=str(tmp_path / "cursors.json"))
+
+    tweets = list(monitor.iter_search("payout", max_results=50))
+    monitor.commit_state()
+
+    assert [tweet["id"] for tweet in tweets] == ["20"]
+    assert "deferring 'payout' to the next cycle" in capsys.readouterr().out
+    # The next cycle searches the same window again
+    assert monitor.get_cursor("payout") is None